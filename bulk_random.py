@@ -0,0 +1,185 @@
+from __future__ import annotations
+import random
+from array import array
+
+
+class BulkRandom:
+    """
+    Générateur aléatoire qui tire ses entiers par lots.
+
+    Les tirages sont faits par blocs de mots de 32 bits avec un random.Random sous-jacent,
+    puis consommés un par un : on évite un appel au générateur pour chaque petit tirage
+    (pile ou face, choix d'un voisin, ...). Les méthodes utilisées par les générations de Maze
+    (choice, shuffle, randint, randrange, getrandbits) sont disponibles,
+    et les tirages restent reproductibles à graine fixée.
+
+    Attributes:
+        rng (random.Random): Le générateur sous-jacent.
+        batch (int): Le nombre de mots de 32 bits tirés à chaque remplissage.
+    """
+
+    def __init__(self, seed=None, batch: int = 4096) -> None:
+        """
+        Crée un nouveau générateur par lots.
+
+        Args:
+            seed (optional): La graine du générateur sous-jacent. Par défaut une graine aléatoire.
+            batch (int, optional): Le nombre de mots de 32 bits tirés à chaque remplissage. Par défaut 4096.
+
+        Returns:
+            None
+        """
+
+        self.rng = random.Random(seed)
+        self.batch = batch
+        self._mots = array("I")
+        self._index = 0
+
+    def _refill(self) -> None:
+        """
+        Tire un nouveau lot de mots de 32 bits.
+
+        Returns:
+            None
+        """
+
+        mots = array("I")
+        mots.frombytes(
+            self.rng.getrandbits(32 * self.batch).to_bytes(4 * self.batch, "little")
+        )
+        self._mots = mots
+        self._index = 0
+
+    def _word(self) -> int:
+        """
+        Retourne le prochain mot de 32 bits du lot.
+
+        Returns:
+            int: Un entier aléatoire entre 0 et 2^32 - 1.
+        """
+
+        if self._index >= len(self._mots):
+            self._refill()
+        mot = self._mots[self._index]
+        self._index += 1
+
+        return mot
+
+    def _below(self, n: int) -> int:
+        """
+        Retourne un entier aléatoire uniforme entre 0 et n - 1.
+
+        Args:
+            n (int): La borne supérieure exclue, strictement positive.
+
+        Returns:
+            int: L'entier tiré.
+        """
+
+        if n > 1 << 32:
+            return self.rng.randrange(n)
+
+        # Rejet des mots au-delà du plus grand multiple de n pour garder un tirage uniforme
+        limite = (1 << 32) - (1 << 32) % n
+        mots = self._mots
+        i = self._index
+        while True:
+            if i >= len(mots):
+                self._refill()
+                mots = self._mots
+                i = 0
+            mot = mots[i]
+            i += 1
+            if mot < limite:
+                self._index = i
+                return mot % n
+
+    def getrandbits(self, k: int) -> int:
+        """
+        Retourne un entier aléatoire de k bits.
+
+        Args:
+            k (int): Le nombre de bits.
+
+        Returns:
+            int: Un entier entre 0 et 2^k - 1.
+        """
+
+        if k > 32:
+            return self.rng.getrandbits(k)
+        if k <= 0:
+            return 0
+
+        return self._word() >> (32 - k)
+
+    def randrange(self, start: int, stop: int = None) -> int:
+        """
+        Retourne un entier aléatoire uniforme dans range(start, stop).
+
+        Args:
+            start (int): La borne inférieure incluse, ou la borne supérieure exclue si 'stop' est absent.
+            stop (int, optional): La borne supérieure exclue.
+
+        Returns:
+            int: L'entier tiré.
+        """
+
+        if stop is None:
+            start, stop = 0, start
+        n = stop - start
+        if n <= 0:
+            raise ValueError(f"Intervalle vide pour randrange({start}, {stop})")
+
+        return start + self._below(n)
+
+    def randint(self, a: int, b: int) -> int:
+        """
+        Retourne un entier aléatoire uniforme entre a et b inclus.
+
+        Args:
+            a (int): La borne inférieure.
+            b (int): La borne supérieure.
+
+        Returns:
+            int: L'entier tiré.
+        """
+
+        return self.randrange(a, b + 1)
+
+    def choice(self, seq):
+        """
+        Retourne un élément aléatoire d'une séquence non vide.
+
+        Args:
+            seq (sequence): La séquence.
+
+        Returns:
+            L'élément tiré.
+        """
+
+        return seq[self._below(len(seq))]
+
+    def shuffle(self, x: list) -> None:
+        """
+        Mélange une liste sur place (mélange de Fisher-Yates).
+
+        Args:
+            x (list): La liste à mélanger.
+
+        Returns:
+            None
+        """
+
+        for i in range(len(x) - 1, 0, -1):
+            j = self._below(i + 1)
+            x[i], x[j] = x[j], x[i]
+
+    def random(self) -> float:
+        """
+        Retourne un flottant aléatoire dans [0, 1).
+
+        Returns:
+            float: Le flottant tiré.
+        """
+
+        return self._word() / (1 << 32)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from maze import Maze
+
+
+class DistanceOracle:
+    """
+    Répond rapidement aux requêtes de distance géodésique sur un labyrinthe parfait.
+
+    Un labyrinthe parfait est un arbre couvrant de la grille : il existe un unique chemin
+    entre deux cellules. On enracine l'arbre en (0, 0) par un parcours en largeur,
+    puis on précalcule les ancêtres 2^k de chaque cellule (binary lifting).
+    Le plus proche ancêtre commun (LCA) de deux cellules se trouve alors en O(log n),
+    et la distance vaut profondeur(c1) + profondeur(c2) - 2 * profondeur(LCA).
+
+    Si le labyrinthe n'est pas un arbre (boucles ou cellules inaccessibles),
+    chaque requête est résolue par un parcours en largeur.
+
+    L'oracle est construit à partir de l'état du labyrinthe au moment de sa création :
+    il faut en construire un nouveau si des murs sont ajoutés ou supprimés.
+
+    Attributes:
+        maze (Maze): Le labyrinthe analysé.
+        is_tree (bool): Indique si le labyrinthe est parfait.
+        depth (list): La profondeur de chaque cellule dans l'arbre, indexée par i * width + j.
+        up (list): up[k][c] est l'ancêtre 2^k de la cellule c (la racine est son propre ancêtre).
+    """
+
+    def __init__(self, maze: Maze) -> None:
+        """
+        Prépare l'oracle pour le labyrinthe donné.
+
+        Args:
+            maze (Maze): Le labyrinthe à analyser.
+
+        Returns:
+            None
+        """
+
+        self.maze = maze
+        self.depth = []
+        self.up = []
+        self.is_tree = False
+
+        h, w = maze.height, maze.width
+        n = h * w
+        if n == 0:
+            return
+
+        # Enracinement par un parcours en largeur depuis (0, 0)
+        parent = [-1] * n
+        depth = [-1] * n
+        parent[0] = 0
+        depth[0] = 0
+        file = deque([(0, 0)])
+        aretes = 0
+        while file:
+            i, j = file.popleft()
+            c = i * w + j
+            for x, y in maze.get_reachable_cells((i, j)):
+                aretes += 1
+                v = x * w + y
+                if depth[v] == -1:
+                    depth[v] = depth[c] + 1
+                    parent[v] = c
+                    file.append((x, y))
+
+        # Chaque passage est compté depuis ses deux cellules :
+        # un arbre couvrant possède exactement n - 1 passages
+        if -1 in depth or aretes != 2 * (n - 1):
+            return
+
+        # Table des ancêtres 2^k
+        up = [parent]
+        for _ in range(max(1, (n - 1).bit_length()) - 1):
+            prev = up[-1]
+            up.append([prev[prev[c]] for c in range(n)])
+
+        self.depth = depth
+        self.up = up
+        self.is_tree = True
+
+    def _lca(self, a: int, b: int) -> int:
+        """
+        Retourne le plus proche ancêtre commun de deux cellules.
+
+        Args:
+            a (int): Une cellule sous forme d'index i * width + j.
+            b (int): Une autre cellule sous forme d'index.
+
+        Returns:
+            int: L'index du plus proche ancêtre commun.
+        """
+
+        depth = self.depth
+        up = self.up
+        if depth[a] < depth[b]:
+            a, b = b, a
+
+        # On remonte 'a' à la profondeur de 'b'
+        diff = depth[a] - depth[b]
+        k = 0
+        while diff:
+            if diff & 1:
+                a = up[k][a]
+            diff >>= 1
+            k += 1
+        if a == b:
+            return a
+
+        # On remonte les deux cellules tant que leurs ancêtres diffèrent
+        for k in range(len(up) - 1, -1, -1):
+            if up[k][a] != up[k][b]:
+                a = up[k][a]
+                b = up[k][b]
+
+        return up[0][a]
+
+    def distance(self, c1: tuple, c2: tuple) -> int:
+        """
+        Retourne la distance géodésique entre deux cellules.
+
+        Args:
+            c1 (tuple): Cellule de départ sous forme d'un couple (x, y).
+            c2 (tuple): Cellule d'arrivée sous forme d'un couple (x, y).
+
+        Returns:
+            int: La longueur du plus court chemin entre c1 et c2, ou None s'il n'existe pas.
+        """
+
+        if not self.is_tree:
+            return self.maze.solve_bfs(c1, c2, distance_only=True)
+
+        w = self.maze.width
+        a = c1[0] * w + c1[1]
+        b = c2[0] * w + c2[1]
+
+        return self.depth[a] + self.depth[b] - 2 * self.depth[self._lca(a, b)]
+
+    def path(self, c1: tuple, c2: tuple) -> list:
+        """
+        Retourne le chemin entre deux cellules, au même format que solve_bfs.
+
+        Args:
+            c1 (tuple): Cellule de départ sous forme d'un couple (x, y).
+            c2 (tuple): Cellule d'arrivée sous forme d'un couple (x, y).
+
+        Returns:
+            list: Une liste de tuples représentant les cellules parcourues pour aller de c1 à c2.
+        """
+
+        if not self.is_tree:
+            return self.maze.solve_bfs(c1, c2)
+
+        w = self.maze.width
+        parent = self.up[0]
+        a = c1[0] * w + c1[1]
+        b = c2[0] * w + c2[1]
+        lca = self._lca(a, b)
+
+        # Montée de c1 jusqu'à l'ancêtre commun (exclu c1)
+        montee = []
+        while a != lca:
+            a = parent[a]
+            montee.append(a)
+
+        # Montée de c2 jusqu'à l'ancêtre commun, parcourue ensuite à l'envers
+        descente = []
+        while b != lca:
+            descente.append(b)
+            b = parent[b]
+        descente.reverse()
+
+        return [divmod(c, w) for c in montee + descente]
@@ -213,8 +213,15 @@ class Game(arcade.Window):
         # On 'remonte' le curseur au coin supérieur gauche du labyrinthe
         start_y += CELL_SIZE * MAZE_HEIGHT
 
+        # Le départ et l'arrivée sont placés aux extrémités du plus long chemin du labyrinthe
+        (start_i, start_j), (stop_i, stop_j), _ = self.maze.diameter()
+
         # Création de la bille
-        self.marble = Marble(start_x + CELL_SIZE / 2, start_y - CELL_SIZE / 2, 0.1)
+        self.marble = Marble(
+            start_x + CELL_SIZE * start_j + CELL_SIZE / 2,
+            start_y - CELL_SIZE * start_i - CELL_SIZE / 2,
+            0.1,
+        )
 
         self.marble_list.append(self.marble)
 
@@ -222,8 +229,8 @@ class Game(arcade.Window):
         self.make_walls(start_x, start_y, maze_walls)
 
         self.win_cell = WinCell(
-            start_x + CELL_SIZE * MAZE_WIDTH - CELL_SIZE / 2,
-            WINDOW_HEIGHT - start_y + CELL_SIZE / 2,
+            start_x + CELL_SIZE * stop_j + CELL_SIZE / 2,
+            start_y - CELL_SIZE * stop_i - CELL_SIZE / 2,
             int(CELL_SIZE - WALL_THICKNESS),
             int(CELL_SIZE - WALL_THICKNESS),
         )
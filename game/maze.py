@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections import deque
 from random import choice, shuffle, randint
 
 
@@ -461,7 +462,7 @@ class Maze:
         y = randint(0, h - 1)
 
         # Marquer cette cellule comme étant visitée
-        cell_visited = set((y, x))
+        cell_visited = {(y, x)}
 
         # Mettre cette cellule sur une pile
         pile = [(y, x)]
@@ -509,44 +510,45 @@ class Maze:
         # Initialisation d’un labyrinthe plein
         lab = cls(h, w, False)
 
-        # Création d'une liste de toutes les cellules
+        # Création d'une liste de toutes les cellules, dans un ordre aléatoire.
+        # L'ordre dans lequel on choisit les cellules de départ des marches
+        # ne change pas la distribution (uniforme) des labyrinthes obtenus.
         cell_unvisited = [(i, j) for i in range(h) for j in range(w)]
+        shuffle(cell_unvisited)
 
-        # Choisir une cellule au hasard sur la grille
-        rand_cell = choice(cell_unvisited)
-        # Retirer la cellule choisie de la liste des cellules non-visitées
-        cell_unvisited.remove(rand_cell)
-        # Marquer cette cellule
-        cell_visited = [rand_cell]
+        # Cellules contigües de chaque cellule, calculées une seule fois
+        contigues = {cell: lab.get_contiguous_cells(cell) for cell in cell_unvisited}
+
+        # Choisir une cellule au hasard sur la grille et la marquer
+        cell_visited = {cell_unvisited.pop()}
 
         # Tant qu’il reste des cellules non marquées
         while cell_unvisited:
             # Choisir une cellule de départ au hasard, parmi les cellules non marquées
-            head = choice(cell_unvisited)
+            start = cell_unvisited.pop()
+            if start in cell_visited:
+                continue
 
-            # Effectuer une marche aléatoire jusqu'à ce qu'une cellule marquée soit atteinte
-            # Initialisation d'une marche aux positions de la cellule de départ
-            marche = [head]
+            # Effectuer une marche aléatoire jusqu'à ce qu'une cellule marquée soit atteinte.
+            # On ne retient que la dernière direction de sortie de chaque cellule :
+            # revenir sur une cellule écrase sa sortie précédente, ce qui efface la boucle.
+            sortie = {}
+            head = start
 
             # Tant que la cellule actuelle n'est pas marquée
             while head not in cell_visited:
-                # Choisir un voisin aléatoirement dans les voisins de la cellule,
-                # l'ajouter dans la marche, puis le définir comme cellule actuelle
-                voisin = choice(lab.get_contiguous_cells(head))
-                marche.append(voisin)
+                # Choisir un voisin aléatoirement dans les voisins de la cellule
+                voisin = choice(contigues[head])
+                sortie[head] = voisin
                 head = voisin
 
-                # Si la tête du serpent se trouve dans le corps,
-                # supprimer toutes les cellules visitées depuis le dernier passage sur la cellule courante
-                if head in marche[:-1]:
-                    marche = marche[: marche.index(head) + 1]
-
-            # Pour chaque cellule dans la 'marche', on la retire des cellules non-visitées et
-            # l'ajoute aux cellules visitées, enfin supprimer le mur entre la cellule[i] et la cellule[i+1] de la marche
-            for i in range(len(marche) - 1):
-                cell_unvisited.remove(marche[i])
-                cell_visited.append(marche[i])
-                lab.remove_wall(marche[i], marche[i + 1])
+            # On refait la marche sans boucle depuis la cellule de départ :
+            # chaque cellule est marquée et le mur vers sa sortie est supprimé
+            head = start
+            while head not in cell_visited:
+                cell_visited.add(head)
+                lab.remove_wall(head, sortie[head])
+                head = sortie[head]
 
         return lab
 
@@ -793,6 +795,53 @@ class Maze:
         # Chemin non-trouvé
         return None
 
+    def farthest(self, source: tuple) -> tuple:
+        """
+        Retourne la cellule la plus éloignée d'une cellule donnée, par un parcours en largeur.
+
+        Args:
+            source (tuple): Cellule de départ sous forme d'un couple (x, y).
+
+        Returns:
+            tuple: Le couple (cellule la plus éloignée, dictionnaire des prédécesseurs).
+        """
+
+        visited = {source: None}
+        file = deque([source])
+        cell = source
+        while file:
+            cell = file.popleft()
+            for neighbor in self.neighbors[cell]:
+                if neighbor not in visited:
+                    visited[neighbor] = cell
+                    file.append(neighbor)
+
+        # La dernière cellule sortie de la file est la plus éloignée
+        return cell, visited
+
+    def diameter(self) -> tuple:
+        """
+        Retourne les deux cellules les plus éloignées l'une de l'autre et le chemin qui les relie.
+
+        Le labyrinthe doit être parfait : la cellule la plus éloignée d'une cellule quelconque
+        est alors une extrémité du plus long chemin, et deux parcours en largeur suffisent.
+
+        Returns:
+            tuple: Le triplet (c1, c2, path) où 'path' est le chemin de c1 à c2 au format de solve_bfs.
+        """
+
+        c1, _ = self.farthest((0, 0))
+        c2, visited = self.farthest(c1)
+
+        # Reconstruction du chemin à partir des prédécesseurs
+        path = []
+        cell = c2
+        while cell != c1:
+            path.append(cell)
+            cell = visited[cell]
+
+        return c1, c2, list(reversed(path))
+
     def distance_geo(self, c1: tuple, c2: tuple) -> int:
         """
         Calcule et retourne la distance géodésique entre deux cellules dans le labyrinthe.
@@ -0,0 +1,124 @@
+from __future__ import annotations
+import struct
+import zlib
+
+# Indices de la palette utilisée par Maze.to_image
+MUR = 0
+SOL = 1
+CHEMIN = 2
+DEGRADE = 3
+NIVEAUX = 256 - DEGRADE
+
+
+def _palette() -> bytes:
+    """
+    Construit la palette de 256 couleurs : mur, sol, chemin, puis un dégradé pour les distances.
+
+    Returns:
+        bytes: Les composantes (rouge, vert, bleu) de chaque couleur, mises bout à bout.
+    """
+
+    couleurs = [(0, 0, 0), (255, 255, 255), (220, 30, 30)]
+    # Dégradé du bleu (distance nulle) au jaune (distance maximale)
+    debut, fin = (30, 60, 200), (250, 220, 40)
+    for t in range(NIVEAUX):
+        couleurs.append(
+            tuple(a + (b - a) * t // (NIVEAUX - 1) for a, b in zip(debut, fin))
+        )
+
+    return bytes(c for couleur in couleurs for c in couleur)
+
+
+PALETTE = _palette()
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    """
+    Construit un bloc PNG : longueur, type, données et somme de contrôle CRC-32.
+
+    Args:
+        kind (bytes): Le type du bloc sur quatre lettres (b"IHDR", b"IDAT", ...).
+        data (bytes): Les données du bloc.
+
+    Returns:
+        bytes: Le bloc encodé.
+    """
+
+    return (
+        struct.pack(">I", len(data))
+        + kind
+        + data
+        + struct.pack(">I", zlib.crc32(data, zlib.crc32(kind)))
+    )
+
+
+def encode_png(
+    width: int, height: int, rows, palette: bytes = PALETTE, level: int = 1
+):
+    """
+    Encode une image en couleurs indexées au format PNG, sans autre dépendance que zlib.
+
+    Les lignes sont compressées au fur et à mesure : seule la ligne courante est en mémoire.
+
+    Args:
+        width (int): La largeur de l'image en pixels.
+        height (int): La hauteur de l'image en pixels.
+        rows (iterable): Les lignes de l'image, chacune de 'width' octets donnant l'indice
+            de la couleur de chaque pixel dans la palette.
+        palette (bytes, optional): Les composantes (rouge, vert, bleu) des couleurs,
+            au plus 256. Par défaut PALETTE.
+        level (int, optional): Le niveau de compression de zlib, de 0 à 9. Par défaut 1 :
+            les niveaux plus élevés gagnent peu sur ces images et sont bien plus lents.
+
+    Yields:
+        bytes: Les morceaux successifs du fichier PNG.
+    """
+
+    yield b"\x89PNG\r\n\x1a\n"
+    # Profondeur 8 bits, couleurs indexées (type 3), sans entrelacement
+    yield _chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0))
+    yield _chunk(b"PLTE", palette)
+
+    compresseur = zlib.compressobj(level)
+    for row in rows:
+        # Chaque ligne est précédée de son filtre : 0, aucun filtre
+        donnees = compresseur.compress(b"\x00" + row)
+        if donnees:
+            yield _chunk(b"IDAT", donnees)
+    yield _chunk(b"IDAT", compresseur.flush())
+    yield _chunk(b"IEND", b"")
+
+
+def encode_ppm(width: int, height: int, rows, palette: bytes = PALETTE):
+    """
+    Encode une image en couleurs indexées au format PPM binaire (P6).
+
+    Chaque ligne est convertie en couleurs par trois tables de traduction, une par composante,
+    dont les résultats sont entrelacés par affectation de tranches.
+
+    Args:
+        width (int): La largeur de l'image en pixels.
+        height (int): La hauteur de l'image en pixels.
+        rows (iterable): Les lignes de l'image, chacune de 'width' octets donnant l'indice
+            de la couleur de chaque pixel dans la palette.
+        palette (bytes, optional): Les composantes (rouge, vert, bleu) des couleurs,
+            au plus 256. Par défaut PALETTE.
+
+    Yields:
+        bytes: Les morceaux successifs du fichier PPM.
+    """
+
+    palette = palette.ljust(3 * 256, b"\x00")
+    tables = [palette[k::3] for k in range(3)]
+
+    yield b"P6\n%d %d\n255\n" % (width, height)
+    precedente = rgb = None
+    for row in rows:
+        # Les lignes répétées (même objet) ne sont converties qu'une fois
+        if row is not precedente:
+            rgb = bytearray(3 * width)
+            for k in range(3):
+                rgb[k::3] = row.translate(tables[k])
+            rgb = bytes(rgb)
+            precedente = row
+        yield rgb
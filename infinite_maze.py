@@ -0,0 +1,231 @@
+from __future__ import annotations
+import hashlib
+import random
+from collections import OrderedDict
+from maze import Maze
+from wall_bitmap import WallBitmap
+
+
+class InfiniteMaze:
+    """
+    Labyrinthe infini découpé en morceaux (chunks) carrés générés à la demande.
+
+    Chaque morceau est un labyrinthe parfait de chunk x chunk cellules, généré par la méthode choisie
+    avec une graine dérivée de ses coordonnées et de la graine globale : un morceau est donc
+    toujours le même, quel que soit l'ordre dans lequel on l'explore.
+    Deux morceaux voisins sont reliés par une ouverture, elle aussi déduite de la graine globale,
+    ce qui rend tout le labyrinthe connexe.
+
+    Les cellules sont des couples (i, j) d'entiers quelconques, éventuellement négatifs.
+    Les morceaux récemment utilisés sont gardés dans un cache LRU de taille bornée.
+
+    Attributes:
+        seed (int): La graine globale.
+        chunk (int): La taille du côté d'un morceau.
+        algorithm (str): Le nom de la méthode de génération des morceaux.
+        cache_size (int): Le nombre maximal de morceaux gardés en mémoire.
+    """
+
+    # Ces solveurs de Maze n'utilisent que get_reachable_cells (et distance_man pour A*)
+    # et s'arrêtent dès que l'arrivée est atteinte : le labyrinthe étant connexe, ils terminent.
+    # Le parcours en profondeur peut s'éloigner indéfiniment sans jamais revenir :
+    # il n'est disponible que sur une région finie, par window(...).solve_dfs.
+    solve_bfs = Maze.solve_bfs
+    solve_astar = Maze.solve_astar
+    solve_bidirectional = Maze.solve_bidirectional
+    distance_man = Maze.distance_man
+
+    def __init__(
+        self,
+        seed: int = 0,
+        chunk: int = 32,
+        algorithm: str = "wilson",
+        cache_size: int = 64,
+    ) -> None:
+        """
+        Crée un nouveau labyrinthe infini.
+
+        Args:
+            seed (int, optional): La graine globale. Par défaut 0.
+            chunk (int, optional): La taille du côté d'un morceau. Par défaut 32.
+            algorithm (str, optional): Le nom de la méthode de génération des morceaux. Par défaut "wilson".
+            cache_size (int, optional): Le nombre maximal de morceaux gardés en mémoire. Par défaut 64.
+
+        Returns:
+            None
+        """
+
+        methode = algorithm if algorithm.startswith("gen_") else "gen_" + algorithm
+        assert hasattr(Maze, methode), f"Méthode de génération inconnue : {algorithm}"
+        assert chunk > 0, f"Taille de morceau invalide : {chunk}"
+        assert cache_size > 0, f"Taille de cache invalide : {cache_size}"
+
+        self.seed = seed
+        self.chunk = chunk
+        self.algorithm = methode
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def _hash(self, *key) -> int:
+        """
+        Dérive un entier de 64 bits de la graine globale et d'une clé.
+
+        Le résultat ne dépend ni de la plateforme ni de la session Python.
+
+        Args:
+            *key: Les éléments de la clé (entiers ou chaînes).
+
+        Returns:
+            int: L'entier dérivé.
+        """
+
+        texte = ":".join(str(k) for k in (self.seed,) + key).encode()
+
+        return int.from_bytes(hashlib.blake2b(texte, digest_size=8).digest(), "little")
+
+    def get_chunk(self, ci: int, cj: int) -> WallBitmap:
+        """
+        Retourne les passages internes d'un morceau, en le générant si besoin.
+
+        Args:
+            ci (int): La ligne du morceau.
+            cj (int): La colonne du morceau.
+
+        Returns:
+            WallBitmap: Les passages du morceau, en coordonnées locales.
+        """
+
+        cache = self._cache
+        bitmap = cache.get((ci, cj))
+        if bitmap is not None:
+            cache.move_to_end((ci, cj))
+            return bitmap
+
+        rng = random.Random(self._hash("chunk", ci, cj))
+        lab = getattr(Maze, self.algorithm)(self.chunk, self.chunk, rng=rng)
+        lab.set_backend("bitmap")
+        bitmap = lab.neighbors
+
+        cache[(ci, cj)] = bitmap
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+        return bitmap
+
+    def _east_gate(self, ci: int, cj: int) -> int:
+        """
+        Retourne la ligne locale de l'ouverture entre un morceau et son voisin de l'est.
+
+        Args:
+            ci (int): La ligne du morceau.
+            cj (int): La colonne du morceau.
+
+        Returns:
+            int: La ligne locale de l'ouverture.
+        """
+
+        return self._hash("east", ci, cj) % self.chunk
+
+    def _south_gate(self, ci: int, cj: int) -> int:
+        """
+        Retourne la colonne locale de l'ouverture entre un morceau et son voisin du sud.
+
+        Args:
+            ci (int): La ligne du morceau.
+            cj (int): La colonne du morceau.
+
+        Returns:
+            int: La colonne locale de l'ouverture.
+        """
+
+        return self._hash("south", ci, cj) % self.chunk
+
+    def get_reachable_cells(self, cell: tuple) -> list:
+        """
+        Retourne la liste des cellules adjacentes et accessibles depuis la cellule donnée.
+
+        Args:
+            cell (tuple): Cellule sous forme d'un couple (x, y).
+
+        Returns:
+            list: Une liste de tuples représentant les cellules accessibles depuis la cellule donnée.
+        """
+
+        i, j = cell
+        size = self.chunk
+        ci, li = divmod(i, size)
+        cj, lj = divmod(j, size)
+        local = self.get_chunk(ci, cj)[(li, lj)]
+
+        reachable = []
+
+        # Nord
+        if (li - 1, lj) in local or (li == 0 and self._south_gate(ci - 1, cj) == lj):
+            reachable.append((i - 1, j))
+        # Sud
+        if (li + 1, lj) in local or (
+            li == size - 1 and self._south_gate(ci, cj) == lj
+        ):
+            reachable.append((i + 1, j))
+        # Ouest
+        if (li, lj - 1) in local or (lj == 0 and self._east_gate(ci, cj - 1) == li):
+            reachable.append((i, j - 1))
+        # Est
+        if (li, lj + 1) in local or (
+            lj == size - 1 and self._east_gate(ci, cj) == li
+        ):
+            reachable.append((i, j + 1))
+
+        return reachable
+
+    def window(self, top: int, left: int, height: int, width: int) -> Maze:
+        """
+        Extrait une région rectangulaire du labyrinthe infini.
+
+        Seuls les passages internes à la région sont conservés :
+        la cellule (top + x, left + y) devient la cellule (x, y) du labyrinthe retourné.
+
+        Args:
+            top (int): La ligne du coin supérieur gauche de la région.
+            left (int): La colonne du coin supérieur gauche de la région.
+            height (int): La hauteur de la région.
+            width (int): La largeur de la région.
+
+        Returns:
+            Maze: Un labyrinthe de dimensions height x width.
+        """
+
+        lab = Maze(height, width, False)
+        for x in range(height):
+            for y in range(width):
+                for i, j in self.get_reachable_cells((top + x, left + y)):
+                    if 0 <= i - top < height and 0 <= j - left < width:
+                        lab.neighbors[(x, y)].add((i - top, j - left))
+
+        return lab
+
+    def overlay(
+        self, top: int, left: int, height: int, width: int, content: dict = {}
+    ) -> str:
+        """
+        Renvoie une représentation textuelle d'une région du labyrinthe avec du contenu dans les cellules.
+
+        Args:
+            top (int): La ligne du coin supérieur gauche de la région.
+            left (int): La colonne du coin supérieur gauche de la région.
+            height (int): La hauteur de la région.
+            width (int): La largeur de la région.
+            content (dict, optional): Un dictionnaire où chaque clé est une cellule, en coordonnées globales,
+                et chaque valeur est le contenu de la cellule. Par défaut le dictionnaire est vide.
+
+        Returns:
+            str: La région représentée sous forme de chaîne de caractères.
+        """
+
+        local = {
+            (i - top, j - left): c
+            for (i, j), c in content.items()
+            if 0 <= i - top < height and 0 <= j - left < width
+        }
+
+        return self.window(top, left, height, width).overlay(local)
@@ -0,0 +1,322 @@
+from __future__ import annotations
+from heapq import heappush, heappop
+from typing import TYPE_CHECKING
+from search_result import SearchResult
+
+if TYPE_CHECKING:
+    from maze import Maze
+
+
+class JunctionGraph:
+    """
+    Graphe pondéré des carrefours et impasses d'un labyrinthe.
+
+    Dans un labyrinthe, la plupart des cellules ont exactement deux passages : ce sont des couloirs,
+    que les solveurs cellule par cellule parcourent sans jamais avoir de choix à faire.
+    On ne garde donc comme sommets que les cellules qui n'ont pas deux passages
+    (impasses, carrefours, cellules isolées), reliées par des arêtes dont le poids
+    est la longueur du couloir qui les sépare.
+    Une boucle formée uniquement de couloirs est rattachée à l'une de ses cellules, promue sommet.
+
+    Les chemins sont calculés sur ce graphe, puis les couloirs ne sont déroulés en cellules
+    que si on le demande. Une cellule de départ ou d'arrivée située dans un couloir
+    est raccordée aux deux extrémités de celui-ci le temps de la requête.
+
+    Le graphe est construit à partir de l'état du labyrinthe au moment de sa création :
+    il faut en construire un nouveau si des murs sont ajoutés ou supprimés.
+
+    Attributes:
+        maze (Maze): Le labyrinthe compressé.
+        adjacency (dict): Pour chaque sommet, la liste de ses arêtes sous la forme
+            (voisin, longueur, couloir, position de départ, position d'arrivée).
+        corridors (list): Pour chaque couloir, le triplet (u, v, cellules) où 'cellules' sont
+            les cellules intérieures du couloir, dans l'ordre de u vers v.
+        position (dict): Pour chaque cellule intérieure d'un couloir, le couple (couloir, k)
+            où k est sa distance à l'extrémité u.
+    """
+
+    def __init__(self, maze: Maze) -> None:
+        """
+        Construit le graphe des carrefours du labyrinthe donné, en un seul passage sur ses cellules.
+
+        Args:
+            maze (Maze): Le labyrinthe à compresser.
+
+        Returns:
+            None
+        """
+
+        self.maze = maze
+        self.adjacency = {}
+        self.corridors = []
+        self.position = {}
+
+        neighbors = maze.neighbors
+        for cell in neighbors:
+            if len(neighbors[cell]) != 2:
+                self.adjacency[cell] = []
+        sommets = list(self.adjacency)
+        for cell in sommets:
+            self._walk(cell)
+
+        # Cellules restantes : boucles formées uniquement de couloirs
+        for cell in neighbors:
+            if cell not in self.adjacency and cell not in self.position:
+                self.adjacency[cell] = []
+                self._walk(cell)
+
+    def __len__(self) -> int:
+        return len(self.adjacency)
+
+    def _walk(self, u: tuple) -> None:
+        """
+        Parcourt les couloirs partant d'un sommet qui n'ont pas encore été enregistrés.
+
+        Args:
+            u (tuple): Le sommet de départ.
+
+        Returns:
+            None
+        """
+
+        neighbors = self.maze.neighbors
+        adjacency = self.adjacency
+        position = self.position
+        for first in neighbors[u]:
+            # Couloir déjà parcouru depuis son autre extrémité
+            if first in position or (first in adjacency and first < u):
+                continue
+
+            e = len(self.corridors)
+            cellules = []
+            prev, cur = u, first
+            while cur not in adjacency:
+                cellules.append(cur)
+                position[cur] = (e, len(cellules))
+                a, b = neighbors[cur]
+                prev, cur = cur, b if a == prev else a
+
+            longueur = len(cellules) + 1
+            self.corridors.append((u, cur, cellules))
+            adjacency[u].append((cur, longueur, e, 0, longueur))
+            adjacency[cur].append((u, longueur, e, longueur, 0))
+
+    def stats(self) -> dict:
+        """
+        Retourne la taille du graphe comparée à celle du labyrinthe.
+
+        Returns:
+            dict: Le nombre de cellules ('cells'), de sommets ('nodes'), d'arêtes ('edges')
+                et le rapport entre le nombre de cellules et le nombre de sommets ('ratio').
+        """
+
+        cellules = self.maze.height * self.maze.width
+
+        return {
+            "cells": cellules,
+            "nodes": len(self.adjacency),
+            "edges": len(self.corridors),
+            "ratio": cellules / len(self.adjacency) if self.adjacency else 0.0,
+        }
+
+    def _segment(self, e: int, a: int, b: int) -> list:
+        """
+        Retourne les cellules d'un couloir entre deux positions.
+
+        Args:
+            e (int): Le numéro du couloir.
+            a (int): La position de départ, exclue (0 pour l'extrémité u).
+            b (int): La position d'arrivée, incluse (la longueur du couloir pour l'extrémité v).
+
+        Returns:
+            list: Les cellules parcourues de la position a à la position b.
+        """
+
+        u, v, cellules = self.corridors[e]
+        complet = [u] + cellules + [v]
+        if a <= b:
+            return complet[a + 1 : b + 1]
+
+        return complet[b:a][::-1]
+
+    def _attach(self, start: tuple, stop: tuple) -> dict:
+        """
+        Raccorde au graphe les cellules de départ et d'arrivée situées dans un couloir.
+
+        Args:
+            start (tuple): Cellule de départ sous forme d'un couple (x, y).
+            stop (tuple): Cellule d'arrivée sous forme d'un couple (x, y).
+
+        Returns:
+            dict: Les arêtes temporaires à ajouter à celles de chaque sommet, au format de 'adjacency'.
+        """
+
+        extra = {}
+        position = self.position
+        if start in position:
+            e, k = position[start]
+            u, v, cellules = self.corridors[e]
+            longueur = len(cellules) + 1
+            extra[start] = [(u, k, e, k, 0), (v, longueur - k, e, k, longueur)]
+        if stop in position:
+            e, k = position[stop]
+            u, v, cellules = self.corridors[e]
+            longueur = len(cellules) + 1
+            extra.setdefault(u, []).append((stop, k, e, 0, k))
+            extra.setdefault(v, []).append((stop, longueur - k, e, longueur, k))
+            # Départ et arrivée dans le même couloir : chemin direct
+            if start in position and position[start][0] == e:
+                ks = position[start][1]
+                extra[start].append((stop, abs(k - ks), e, ks, k))
+
+        return extra
+
+    def _search(self, start: tuple, stop: tuple, heuristic) -> tuple:
+        """
+        Recherche du plus court chemin sur le graphe, selon l'algorithme A*.
+
+        Args:
+            start (tuple): Cellule de départ sous forme d'un couple (x, y).
+            stop (tuple): Cellule d'arrivée sous forme d'un couple (x, y).
+            heuristic (callable): Fonction heuristic(c1, c2) minorant la distance entre deux cellules,
+                ou None pour l'algorithme de Dijkstra.
+
+        Returns:
+            tuple: La longueur du chemin, la liste des portions de couloirs (couloir, départ, arrivée)
+                parcourues, le nombre de sommets développés et le nombre de sommets découverts.
+                None si le chemin n'existe pas.
+        """
+
+        if start == stop:
+            return 0, [], 0, 1
+
+        adjacency = self.adjacency
+        extra = self._attach(start, stop)
+        h = heuristic(start, stop) if heuristic else 0
+        tas = [(h, 0, start)]
+        g = {start: 0}
+        visited = {start: None}
+        closed = set()
+
+        while tas:
+            _, d, cell = heappop(tas)
+            if cell in closed:
+                continue
+            closed.add(cell)
+
+            if cell == stop:
+                # Reconstruction des portions de couloirs à partir des prédécesseurs
+                portions = []
+                while cell != start:
+                    cell, e, a, b = visited[cell]
+                    portions.append((e, a, b))
+                portions.reverse()
+                return d, portions, len(closed), len(visited)
+
+            aretes = adjacency.get(cell, ())
+            if cell in extra:
+                aretes = list(aretes) + extra[cell]
+            for voisin, longueur, e, a, b in aretes:
+                g_voisin = d + longueur
+                if voisin not in closed and (voisin not in g or g_voisin < g[voisin]):
+                    g[voisin] = g_voisin
+                    visited[voisin] = (cell, e, a, b)
+                    h = heuristic(voisin, stop) if heuristic else 0
+                    heappush(tas, (g_voisin + h, g_voisin, voisin))
+
+        # Chemin non-trouvé
+        return None
+
+    def _result(self, found: tuple, expand: bool) -> SearchResult:
+        """
+        Construit le résultat d'une recherche, en déroulant éventuellement les couloirs.
+
+        Args:
+            found (tuple): Le résultat de _search, ou None.
+            expand (bool): Si vrai, retourne toutes les cellules du chemin,
+                sinon uniquement les sommets du graphe traversés et la cellule d'arrivée.
+
+        Returns:
+            SearchResult: Le chemin au format de solve_bfs, ou None s'il n'existe pas.
+        """
+
+        if found is None:
+            return None
+
+        _, portions, expanded, visited = found
+        if expand:
+            cellules = []
+            for e, a, b in portions:
+                cellules += self._segment(e, a, b)
+        else:
+            cellules = [self._segment(e, a, b)[-1] for e, a, b in portions]
+
+        return SearchResult(cellules, expanded=expanded, visited=visited)
+
+    def dijkstra(self, start: tuple, stop: tuple, expand: bool = True) -> SearchResult:
+        """
+        Retourne le plus court chemin entre deux cellules, selon l'algorithme de Dijkstra sur le graphe.
+
+        Args:
+            start (tuple): Cellule de départ sous forme d'un couple (x, y).
+            stop (tuple): Cellule d'arrivée sous forme d'un couple (x, y).
+            expand (bool, optional): Si vrai, déroule les couloirs en cellules.
+                Sinon, seuls les sommets du graphe traversés et 'stop' sont retournés. Par défaut True.
+
+        Returns:
+            SearchResult: Une liste de tuples représentant les cellules parcourues pour atteindre 'stop',
+                dont l'attribut 'expanded' donne le nombre de sommets développés.
+        """
+
+        return self._result(self._search(start, stop, None), expand)
+
+    def astar(
+        self, start: tuple, stop: tuple, heuristic=None, expand: bool = True
+    ) -> SearchResult:
+        """
+        Retourne le plus court chemin entre deux cellules, selon l'algorithme A* sur le graphe.
+
+        La longueur d'un couloir est toujours au moins égale à la distance de Manhattan
+        entre ses extrémités : l'heuristique par défaut reste admissible et cohérente.
+
+        Args:
+            start (tuple): Cellule de départ sous forme d'un couple (x, y).
+            stop (tuple): Cellule d'arrivée sous forme d'un couple (x, y).
+            heuristic (callable, optional): Fonction heuristic(c1, c2) estimant la distance entre deux cellules.
+                Par défaut la distance de Manhattan (distance_man).
+            expand (bool, optional): Si vrai, déroule les couloirs en cellules. Par défaut True.
+
+        Returns:
+            SearchResult: Une liste de tuples représentant les cellules parcourues pour atteindre 'stop',
+                dont l'attribut 'expanded' donne le nombre de sommets développés.
+        """
+
+        if heuristic is None:
+            heuristic = self.maze.distance_man
+
+        return self._result(self._search(start, stop, heuristic), expand)
+
+    def solve_bfs(
+        self, start: tuple, stop: tuple, distance_only: bool = False
+    ) -> list | int:
+        """
+        Équivalent de Maze.solve_bfs calculé sur le graphe : chemin de même longueur, même format.
+
+        Args:
+            start (tuple): Cellule de départ sous forme d'un couple (x, y).
+            stop (tuple): Cellule d'arrivée sous forme d'un couple (x, y).
+            distance_only (bool, optional): Si vrai, retourne uniquement la longueur du plus court chemin
+                sans dérouler les couloirs. Par défaut False.
+
+        Returns:
+            list: Une liste de tuples représentant les cellules parcourues pour atteindre 'stop'.
+                Si 'distance_only' est vrai, un entier représentant la longueur de ce chemin.
+        """
+
+        found = self._search(start, stop, None)
+        if found is None:
+            return None
+        if distance_only:
+            return found[0]
+
+        return list(self._result(found, True))
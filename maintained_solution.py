@@ -0,0 +1,568 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from maze import Maze
+
+
+class MaintainedSolution:
+    """
+    Solution d'un labyrinthe tenue à jour au fil des ajouts et suppressions de murs.
+
+    L'objet s'abonne aux modifications du labyrinthe (voir Maze.add_listener) et,
+    plutôt que de tout recalculer à chaque mur modifié :
+
+    - ajout d'un mur hors du chemin : rien à faire, les distances ne peuvent qu'augmenter ;
+    - ajout d'un mur sur le chemin : deux parcours en largeur, partis des deux cellules séparées,
+      cherchent à rejoindre l'autre morceau du chemin ; le premier qui y parvient fournit le détour.
+      Si l'un des deux s'épuise, le départ et l'arrivée ne sont plus reliés ;
+    - suppression d'un mur : deux parcours en largeur partent des deux cellules, sans emprunter
+      le nouveau passage, jusqu'au chemin. Le passage n'est utilisé que s'il raccourcit le chemin.
+      Si les deux parcours se rejoignent avant le chemin, le passage ne peut pas le raccourcir ;
+    - suppression d'un mur alors qu'aucun chemin n'existe : on garde les cellules accessibles
+      depuis l'une des deux extrémités, avec leur arbre de parcours, et les deux morceaux de l'ancien chemin.
+      Si le passage sort de cette région, le nouveau chemin est raccordé à partir de ces morceaux ;
+    - fill et empty : recalcul complet.
+
+    Tant que la partie du labyrinthe accessible depuis le départ est un arbre (labyrinthe parfait),
+    on garde plutôt son arbre de parcours enraciné au départ, avec les passages coupés depuis :
+    couper le chemin ne demande alors aucun parcours, et un passage qui relie deux morceaux
+    de l'arbre s'y raccroche en retournant les parents entre la cellule et la racine de son morceau.
+
+    Sur un labyrinthe parfait, le chemin obtenu est toujours le plus court.
+    Sur un labyrinthe à boucles, il reste valide mais peut être plus long que le plus court :
+    recompute() permet alors de repartir d'un plus court chemin.
+
+    Attributes:
+        maze (Maze): Le labyrinthe suivi.
+        start (tuple): La cellule de départ.
+        stop (tuple): La cellule d'arrivée.
+        cells (list): Les cellules du chemin, 'start' et 'stop' compris, ou None s'il n'existe pas.
+        unchanged (int): Le nombre de modifications sans effet sur le chemin.
+        repaired (int): Le nombre de modifications traitées par une réparation locale.
+        disconnected (int): Le nombre de modifications ayant séparé le départ de l'arrivée.
+        recomputed (int): Le nombre de modifications traitées par un recalcul complet.
+    """
+
+    def __init__(self, maze: Maze, start: tuple, stop: tuple) -> None:
+        """
+        Calcule le chemin entre 'start' et 'stop', puis s'abonne aux modifications du labyrinthe.
+
+        Args:
+            maze (Maze): Le labyrinthe à suivre.
+            start (tuple): Cellule de départ sous forme d'un couple (x, y).
+            stop (tuple): Cellule d'arrivée sous forme d'un couple (x, y).
+
+        Returns:
+            None
+        """
+
+        self.maze = maze
+        self.start = start
+        self.stop = stop
+        self.unchanged = 0
+        self.repaired = 0
+        self.disconnected = 0
+        self.recomputed = 0
+        self.cells = None
+        self.pos = {}
+        self.recompute()
+        maze.add_listener(self._on_change)
+
+    @property
+    def path(self) -> list:
+        """
+        Le chemin au même format que solve_bfs (sans la cellule de départ), ou None.
+        """
+
+        return None if self.cells is None else self.cells[1:]
+
+    def recompute(self) -> None:
+        """
+        Recalcule le chemin par un parcours en largeur complet depuis le départ.
+
+        Le parcours couvre toute la partie accessible depuis le départ, pour savoir si c'est un arbre.
+
+        Returns:
+            None
+        """
+
+        neighbors = self.maze.neighbors
+        parents = {self.start: None}
+        frontiere = [self.start]
+        passages = 0
+        while frontiere:
+            suivants = []
+            for cell in frontiere:
+                for v in neighbors[cell]:
+                    passages += 1
+                    if v not in parents:
+                        parents[v] = cell
+                        suivants.append(v)
+            frontiere = suivants
+
+        # Chaque passage est compté depuis ses deux cellules
+        self._parent = parents if passages == 2 * (len(parents) - 1) else None
+        self._cuts = set()
+        if self.stop in parents:
+            cells = self._chain(parents, self.stop)
+            cells.reverse()
+            self._set(cells)
+        else:
+            self._set(None, parents, [self.start, self.stop], 1)
+
+    def detach(self) -> None:
+        """
+        Désabonne l'objet des modifications du labyrinthe : le chemin n'est plus mis à jour.
+
+        Returns:
+            None
+        """
+
+        self.maze.remove_listener(self._on_change)
+
+    def stats(self) -> dict:
+        """
+        Retourne le nombre de modifications traitées par chaque stratégie.
+
+        Returns:
+            dict: Les compteurs 'unchanged', 'repaired', 'disconnected' et 'recomputed'.
+        """
+
+        return {
+            "unchanged": self.unchanged,
+            "repaired": self.repaired,
+            "disconnected": self.disconnected,
+            "recomputed": self.recomputed,
+        }
+
+    def _set(
+        self, cells: list, isolated: dict = None, old: list = None, split: int = 0
+    ) -> None:
+        """
+        Remplace le chemin et reconstruit l'index des positions.
+
+        Args:
+            cells (list): Les cellules du nouveau chemin, ou None.
+            isolated (dict, optional): Si le chemin n'existe pas, l'arbre de parcours (parent de chaque cellule)
+                d'une région contenant une extrémité et toutes les cellules qui lui sont accessibles,
+                mais pas l'autre extrémité. Sa racine est sur l'ancien chemin.
+            old (list, optional): L'ancien chemin, coupé en deux morceaux par la séparation :
+                old[:split] part du départ, old[split:] mène à l'arrivée.
+            split (int, optional): La position de la coupure dans 'old'.
+
+        Returns:
+            None
+        """
+
+        # Position de chaque cellule dans l'ancien chemin
+        if old is None:
+            self._old_pos = {}
+        elif old is self.cells:
+            # L'ancien chemin est le chemin coupé : ses positions sont déjà connues
+            self._old_pos = self.pos
+        else:
+            self._old_pos = dict(zip(old, range(len(old))))
+        self._old = old
+        self._split = split
+        self._isolated = isolated
+        self.cells = cells
+        # Position de chaque cellule dans le chemin
+        self.pos = {} if cells is None else dict(zip(cells, range(len(cells))))
+
+    def _on_change(self, event: str, c1: tuple, c2: tuple) -> None:
+        """
+        Met le chemin à jour après une modification du labyrinthe.
+
+        Args:
+            event (str): Le type de modification.
+            c1 (tuple): La première cellule du mur modifié, ou None.
+            c2 (tuple): La seconde cellule du mur modifié, ou None.
+
+        Returns:
+            None
+        """
+
+        if event not in ("add_wall", "remove_wall"):
+            self.recompute()
+            resultat = "recomputed"
+        elif self._parent is not None:
+            if event == "add_wall":
+                resultat = self._on_cut(c1, c2)
+            else:
+                resultat = self._on_link(c1, c2)
+        elif event == "add_wall":
+            resultat = self._on_add_wall(c1, c2)
+        elif self.cells is not None:
+            resultat = self._on_remove_wall(c1, c2)
+        else:
+            resultat = self._on_bridge(c1, c2)
+
+        setattr(self, resultat, getattr(self, resultat) + 1)
+
+    def _expand(
+        self, frontier: list, parents: dict, target, other: dict = None, edge=None
+    ) -> tuple:
+        """
+        Développe un niveau d'un parcours en largeur.
+
+        Args:
+            frontier (list): Les cellules du niveau courant.
+            parents (dict): Le prédécesseur de chaque cellule découverte, complété sur place.
+            target (callable): Indique si une cellule découverte termine la recherche.
+            other (dict, optional): Les cellules découvertes par un autre parcours.
+                Les rencontrer termine aussi la recherche.
+            edge (set, optional): Les deux orientations (c1, c2) et (c2, c1) d'un passage à ne pas emprunter.
+
+        Returns:
+            tuple: Le niveau suivant, la cellule cible trouvée (ou None)
+                et un booléen indiquant si l'autre parcours a été rencontré.
+        """
+
+        neighbors = self.maze.neighbors
+        suivants = []
+        for cell in frontier:
+            for v in neighbors[cell]:
+                if v in parents:
+                    continue
+                if edge is not None and (cell, v) in edge:
+                    continue
+                parents[v] = cell
+                if target(v):
+                    return suivants, v, False
+                if other is not None and v in other:
+                    return suivants, None, True
+                suivants.append(v)
+
+        return suivants, None, False
+
+    @staticmethod
+    def _chain(parents: dict, cell: tuple) -> list:
+        """
+        Remonte les prédécesseurs d'une cellule jusqu'à l'origine du parcours.
+
+        Args:
+            parents (dict): Le prédécesseur de chaque cellule découverte.
+            cell (tuple): La cellule de départ de la remontée.
+
+        Returns:
+            list: Les cellules de 'cell' jusqu'à l'origine du parcours, toutes deux comprises.
+        """
+
+        chaine = []
+        while cell is not None:
+            chaine.append(cell)
+            cell = parents[cell]
+
+        return chaine
+
+    def _on_add_wall(self, c1: tuple, c2: tuple) -> str:
+        """
+        Répare le chemin après l'ajout d'un mur entre c1 et c2.
+
+        Args:
+            c1 (tuple): La première cellule du mur.
+            c2 (tuple): La seconde cellule du mur.
+
+        Returns:
+            str: La stratégie employée, "unchanged", "repaired" ou "disconnected".
+        """
+
+        if self.cells is None:
+            # Le mur peut couper l'arbre de la région isolée ou un morceau de l'ancien chemin :
+            # la région reste valide, mais on ne pourra plus raccorder le chemin à partir d'eux
+            isolated = self._isolated
+            q1 = self._old_pos.get(c1)
+            q2 = self._old_pos.get(c2)
+            if (
+                isolated.get(c1) == c2
+                or isolated.get(c2) == c1
+                or (q1 is not None and q2 is not None and abs(q1 - q2) == 1)
+            ):
+                self._old = None
+            return "unchanged"
+
+        pos = self.pos
+        p1 = pos.get(c1)
+        p2 = pos.get(c2)
+        # Le mur ne coupe pas le chemin : celui-ci reste valide et toujours le plus court
+        if p1 is None or p2 is None or abs(p1 - p2) != 1:
+            return "unchanged"
+
+        cells = self.cells
+        i = min(p1, p2)
+        a, b = cells[i], cells[i + 1]
+
+        # 'a' cherche à rejoindre la suite du chemin, 'b' à rejoindre le début
+        parents_a = {a: None}
+        parents_b = {b: None}
+        frontiere_a = [a]
+        frontiere_b = [b]
+        while frontiere_a and frontiere_b:
+            if len(frontiere_a) <= len(frontiere_b):
+                frontiere_a, cible, _ = self._expand(
+                    frontiere_a, parents_a, lambda c: pos.get(c, -1) > i
+                )
+                if cible is None:
+                    continue
+                # Détour de a jusqu'à la cible, repris depuis la dernière cellule du début du chemin
+                detour = self._chain(parents_a, cible)
+                detour.reverse()
+                t = max(k for k, c in enumerate(detour) if pos.get(c, i + 1) <= i)
+                self._set(
+                    cells[: pos[detour[t]]] + detour[t:] + cells[pos[cible] + 1 :]
+                )
+                return "repaired"
+            else:
+                frontiere_b, cible, _ = self._expand(
+                    frontiere_b, parents_b, lambda c: pos.get(c, i + 1) <= i
+                )
+                if cible is None:
+                    continue
+                # Détour de la cible jusqu'à b, coupé à la première cellule de la suite du chemin
+                detour = self._chain(parents_b, cible)
+                t = next(k for k, c in enumerate(detour) if pos.get(c, -1) > i)
+                self._set(
+                    cells[: pos[cible]]
+                    + detour[: t + 1]
+                    + cells[pos[detour[t]] + 1 :]
+                )
+                return "repaired"
+
+        # L'un des deux parcours s'est épuisé : le départ et l'arrivée sont séparés
+        self._set(None, parents_b if frontiere_a else parents_a, cells, i + 1)
+
+        return "disconnected"
+
+    def _on_remove_wall(self, c1: tuple, c2: tuple) -> str:
+        """
+        Raccourcit éventuellement le chemin après la suppression du mur entre c1 et c2.
+
+        Args:
+            c1 (tuple): La première cellule du mur.
+            c2 (tuple): La seconde cellule du mur.
+
+        Returns:
+            str: La stratégie employée, "unchanged" ou "repaired".
+        """
+
+        pos = self.pos
+        arete = {(c1, c2), (c2, c1)}
+
+        # Recherche de la cellule du chemin la plus proche de c1 et de c2, sans le nouveau passage
+        parents_1 = {c1: None}
+        parents_2 = {c2: None}
+        cible_1 = c1 if c1 in pos else None
+        cible_2 = c2 if c2 in pos else None
+        frontiere_1 = [c1]
+        frontiere_2 = [c2]
+        while cible_1 is None or cible_2 is None:
+            if cible_1 is None and (
+                cible_2 is not None or len(frontiere_1) <= len(frontiere_2)
+            ):
+                frontiere_1, cible_1, rencontre = self._expand(
+                    frontiere_1, parents_1, pos.__contains__, parents_2, arete
+                )
+                epuise = not frontiere_1 and cible_1 is None
+            else:
+                frontiere_2, cible_2, rencontre = self._expand(
+                    frontiere_2, parents_2, pos.__contains__, parents_1, arete
+                )
+                epuise = not frontiere_2 and cible_2 is None
+            # c1 et c2 se rejoignent hors du chemin, ou l'un d'eux ne peut pas l'atteindre :
+            # le nouveau passage ne raccourcit pas le chemin
+            if rencontre or epuise:
+                return "unchanged"
+
+        # Orientation du passage dans le sens du chemin
+        if pos[cible_1] > pos[cible_2]:
+            c1, c2 = c2, c1
+            cible_1, cible_2 = cible_2, cible_1
+            parents_1, parents_2 = parents_2, parents_1
+        debut = self._chain(parents_1, cible_1)
+        fin = self._chain(parents_2, cible_2)
+        fin.reverse()
+        if len(debut) + len(fin) - 1 >= pos[cible_2] - pos[cible_1]:
+            return "unchanged"
+
+        cells = self.cells
+        self._set(cells[: pos[cible_1]] + debut + fin + cells[pos[cible_2] + 1 :])
+
+        return "repaired"
+
+    def _on_bridge(self, c1: tuple, c2: tuple) -> str:
+        """
+        Raccorde éventuellement le départ et l'arrivée après la suppression du mur entre c1 et c2,
+        alors qu'aucun chemin n'existe.
+
+        Args:
+            c1 (tuple): La première cellule du mur.
+            c2 (tuple): La seconde cellule du mur.
+
+        Returns:
+            str: La stratégie employée, "unchanged", "repaired" ou "recomputed".
+        """
+
+        isolated = self._isolated
+        if (c1 in isolated) == (c2 in isolated):
+            # Le passage ne sort pas de la région isolée : toujours aucun chemin
+            return "unchanged"
+        if self._old is None:
+            self.recompute()
+            return "recomputed"
+        if c2 in isolated:
+            c1, c2 = c2, c1
+
+        old = self._old
+        pos = self._old_pos
+        split = self._split
+        depart_isole = old[split - 1] in isolated
+
+        # Remontée de c1 dans l'arbre de la région isolée jusqu'à l'ancien chemin
+        chaine = [c1]
+        while chaine[-1] not in pos:
+            chaine.append(isolated[chaine[-1]])
+
+        # Parcours depuis c2, sans le nouveau passage, jusqu'au morceau de l'autre extrémité
+        def cible(c: tuple) -> bool:
+            return c in pos and (pos[c] >= split) == depart_isole
+
+        parents = {c2: None}
+        trouve = c2 if cible(c2) else None
+        frontiere = [c2]
+        arete = {(c1, c2), (c2, c1)}
+        while frontiere and trouve is None:
+            frontiere, trouve, _ = self._expand(frontiere, parents, cible, None, arete)
+
+        if trouve is None:
+            # La région de c2 ne contient pas l'autre extrémité : elle rejoint la région isolée
+            parents[c2] = c1
+            isolated.update(parents)
+            return "unchanged"
+
+        dehors = self._chain(parents, trouve)
+        if depart_isole:
+            chaine.reverse()
+            dehors.reverse()
+            cells = old[: pos[chaine[0]]] + chaine + dehors + old[pos[trouve] + 1 :]
+        else:
+            cells = old[: pos[trouve]] + dehors + chaine + old[pos[chaine[-1]] + 1 :]
+        self._set(cells)
+
+        return "repaired"
+
+    def _root(self, cell: tuple) -> tuple:
+        """
+        Retourne la racine du morceau de l'arbre de parcours contenant une cellule.
+
+        Args:
+            cell (tuple): La cellule.
+
+        Returns:
+            tuple: Le départ, ou la cellule dont le passage vers son parent a été coupé.
+        """
+
+        parent = self._parent
+        cuts = self._cuts
+        while cell not in cuts and parent[cell] is not None:
+            cell = parent[cell]
+
+        return cell
+
+    def _on_cut(self, c1: tuple, c2: tuple) -> str:
+        """
+        Enregistre l'ajout d'un mur entre c1 et c2 lorsque la partie accessible est un arbre.
+
+        Args:
+            c1 (tuple): La première cellule du mur.
+            c2 (tuple): La seconde cellule du mur.
+
+        Returns:
+            str: La stratégie employée, "unchanged", "disconnected" ou "recomputed".
+        """
+
+        parent = self._parent
+        if c1 not in parent:
+            # Mur hors de la partie accessible depuis le départ
+            return "unchanged"
+        if parent.get(c2) == c1:
+            coupe = c2
+        elif parent.get(c1) == c2:
+            coupe = c1
+        else:
+            self.recompute()
+            return "recomputed"
+
+        self._cuts.add(coupe)
+        # Dans un arbre, un passage dont les deux cellules sont sur le chemin en fait partie.
+        # L'ancien chemin est gardé, pour le cas où le même mur serait supprimé.
+        pos = self.pos if self.cells is not None else self._old_pos
+        if c1 in pos and c2 in pos:
+            if self.cells is None:
+                self._old = None
+                return "unchanged"
+            self._set(None, None, self.cells, max(pos[c1], pos[c2]))
+            return "disconnected"
+
+        return "unchanged"
+
+    def _on_link(self, c1: tuple, c2: tuple) -> str:
+        """
+        Enregistre la suppression du mur entre c1 et c2 lorsque la partie accessible est un arbre.
+
+        Args:
+            c1 (tuple): La première cellule du mur.
+            c2 (tuple): La seconde cellule du mur.
+
+        Returns:
+            str: La stratégie employée, "unchanged", "repaired" ou "recomputed".
+        """
+
+        parent = self._parent
+        if c1 not in parent and c2 not in parent:
+            return "unchanged"
+        if c1 not in parent or c2 not in parent:
+            # Le passage rejoint une partie jamais parcourue
+            self.recompute()
+            return "recomputed"
+
+        r1 = self._root(c1)
+        r2 = self._root(c2)
+        if r1 == r2:
+            # Le passage crée une boucle : on repasse au cas général
+            self._parent = None
+            if self.cells is not None:
+                return self._on_remove_wall(c1, c2)
+            self.recompute()
+            return "recomputed"
+
+        # Le morceau qui ne contient pas le départ est retourné, puis suspendu par le nouveau passage
+        if r2 == self.start:
+            c1, c2, r1, r2 = c2, c1, r2, r1
+        prev, cell = c1, c2
+        while cell != r2:
+            parent[cell], prev, cell = prev, cell, parent[cell]
+        parent[r2] = prev
+        self._cuts.discard(r2)
+
+        old = self._old
+        if (
+            self.cells is None
+            and old is not None
+            and {c1, c2} == {old[self._split - 1], old[self._split]}
+        ):
+            # Le mur qui avait coupé le chemin est supprimé : l'ancien chemin est de nouveau valide
+            self.cells = old
+            self.pos = self._old_pos
+            self._old = None
+            self._old_pos = {}
+            return "repaired"
+
+        stop = self.stop
+        if self.cells is None and stop in parent and self._root(stop) == self.start:
+            cells = self._chain(parent, stop)
+            cells.reverse()
+            self._set(cells)
+            return "repaired"
+
+        return "unchanged"
@@ -1,5 +1,233 @@
 from __future__ import annotations
-from random import choice, shuffle, randint
+import copy
+import functools
+import os
+import random
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappush, heappop
+from image_export import CHEMIN, DEGRADE, MUR, NIVEAUX, SOL
+from image_export import encode_png, encode_ppm
+from itertools import count
+from junction_graph import JunctionGraph
+from search_result import SearchResult
+from solver_cache import SolverCache
+from union_find import UnionFind
+from wall_bitmap import WallBitmap
+
+# Table de conversion des caractères '0' / '1' en octets 0 / 1
+_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _pieces(row: bytes, ferme: str, ouvert: str) -> str:
+    """
+    Convertit une ligne de passages en texte, un morceau par cellule.
+
+    Les remplacements se font sur les octets, sans boucle Python : les morceaux encodés en UTF-8
+    ne contiennent ni l'octet 0 ni l'octet 1, ils ne sont donc jamais remplacés à leur tour.
+
+    Args:
+        row (bytes): Les passages de la ligne, un octet valant 0 ou 1 par cellule.
+        ferme (str): Le morceau d'une cellule dont le passage est fermé.
+        ouvert (str): Le morceau d'une cellule dont le passage est ouvert.
+
+    Returns:
+        str: Les morceaux de toutes les cellules, mis bout à bout.
+    """
+
+    return (
+        row.replace(b"\x01", ouvert.encode()).replace(b"\x00", ferme.encode()).decode()
+    )
+
+
+def _random_bits(n: int, rng=random) -> bytes:
+    """
+    Tire n bits aléatoires d'un seul coup.
+
+    Args:
+        n (int): Le nombre de bits à tirer.
+        rng (optional): Le générateur aléatoire. Par défaut le module random.
+
+    Returns:
+        bytes: n octets valant chacun 0 ou 1.
+    """
+
+    if n <= 0:
+        return b""
+    return format(rng.getrandbits(n), f"0{n}b").encode().translate(_BITS)
+
+
+def _gen_one(task: tuple) -> Maze:
+    """
+    Génère un labyrinthe à partir d'une graine, dans un processus de travail de gen_many ou gen_tiled.
+
+    Args:
+        task (tuple): Un quadruplet (nom de la méthode de génération, h, w, graine).
+
+    Returns:
+        Maze: Le labyrinthe généré, stocké sous forme de WallBitmap.
+    """
+
+    methode, h, w, graine = task
+    lab = getattr(Maze, methode)(h, w, rng=random.Random(graine))
+    lab.set_backend("bitmap")
+
+    return lab
+
+
+# Marqueur d'un résultat absent du cache des solveurs (None est un résultat valide)
+_ABSENT = object()
+
+
+def _cached_solver(solver):
+    """
+    Décore un solveur pour mettre ses résultats dans le cache du labyrinthe.
+
+    La clé contient la version du labyrinthe, le nom du solveur, les cellules de départ et d'arrivée
+    et les options. Une copie du résultat est retournée pour que le cache ne puisse pas être modifié.
+
+    Args:
+        solver (callable): La méthode de résolution.
+
+    Returns:
+        callable: La méthode décorée.
+    """
+
+    @functools.wraps(solver)
+    def wrapper(self, start, stop, *args, **kwargs):
+        cache = getattr(self, "solver_cache", None)
+        if cache is None or not cache.enabled:
+            return solver(self, start, stop, *args, **kwargs)
+
+        key = (
+            self.version,
+            solver.__name__,
+            start,
+            stop,
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            # Options non hachables : pas de mise en cache
+            return solver(self, start, stop, *args, **kwargs)
+
+        result = cache.get(key, _ABSENT)
+        if result is _ABSENT:
+            result = solver(self, start, stop, *args, **kwargs)
+            cache.put(key, result)
+
+        return copy.copy(result)
+
+    return wrapper
+
+
+# Labyrinthe partagé par les processus de travail de solve_many
+_worker_maze = None
+
+
+def _init_solve_worker(maze: Maze) -> None:
+    """
+    Initialise un processus de travail de solve_many avec le labyrinthe à résoudre.
+
+    Args:
+        maze (Maze): Le labyrinthe, transmis une seule fois par processus, ou None pour l'oublier.
+
+    Returns:
+        None
+    """
+
+    global _worker_maze
+    _worker_maze = maze
+
+
+def _solve_source(groupe: tuple) -> list:
+    """
+    Résout, dans un processus de travail de solve_many, les requêtes d'une cellule source.
+
+    Args:
+        groupe (tuple): Le couple (source, liste des cellules d'arrivée).
+
+    Returns:
+        list: La liste des chemins vers chacune des cellules d'arrivée.
+    """
+
+    source, stops = groupe
+
+    return _worker_maze._solve_from(source, stops)
+
+
+def _diameter_one(task: tuple) -> tuple:
+    """
+    Calcule le diamètre d'un labyrinthe, pour diameter_many.
+
+    Args:
+        task (tuple): Le couple (labyrinthe, exact).
+
+    Returns:
+        tuple: Le triplet (c1, c2, longueur du chemin), ou None si le labyrinthe est vide.
+    """
+
+    maze, exact = task
+    resultat = maze.diameter(exact)
+    if resultat is None:
+        return None
+    c1, c2, path = resultat
+
+    return c1, c2, len(path)
+
+
+def _metrics_one(task: tuple) -> dict:
+    """
+    Calcule les statistiques d'un labyrinthe, pour metrics_many.
+
+    Args:
+        task (tuple): Le triplet (labyrinthe, start, stop).
+
+    Returns:
+        dict: Les statistiques retournées par metrics.
+    """
+
+    maze, start, stop = task
+
+    return maze.metrics(start, stop)
+
+
+def _pool_map(
+    func, tasks: list, workers: int = 1, initializer=None, initargs: tuple = ()
+) -> list:
+    """
+    Applique une fonction à une liste de tâches, éventuellement sur plusieurs processus.
+
+    Args:
+        func (callable): La fonction appliquée à chaque tâche, définie au niveau du module
+            pour pouvoir être transmise aux processus.
+        tasks (list): Les tâches.
+        workers (int, optional): Le nombre de processus. Par défaut 1, c'est-à-dire dans le processus courant.
+            Avec None, le nombre de cœurs de la machine.
+        initializer (callable, optional): Fonction appelée une fois par processus avant les tâches,
+            ou une fois dans le processus courant. Par défaut aucune.
+        initargs (tuple, optional): Les arguments de 'initializer'.
+
+    Returns:
+        list: Les résultats, dans l'ordre des tâches.
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(tasks) <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return [func(task) for task in tasks]
+
+    # On regroupe les tâches pour limiter les échanges entre processus
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as pool:
+        return list(pool.map(func, tasks, chunksize=chunksize))
 
 
 class Maze:
@@ -10,13 +238,28 @@ class Maze:
     et les valeurs sont les ensembles des sommets voisins accessibles.
     Chaque sommet est une cellule sous forme d'un couple (x, y).
 
+    Pour les grands labyrinthes, le dictionnaire peut être remplacé par un WallBitmap
+    (backend "bitmap") qui stocke les passages dans deux tableaux d'octets
+    tout en s'utilisant de la même manière.
+
+    Les résultats des solveurs peuvent être mis en cache dans 'solver_cache' selon la version du labyrinthe,
+    incrémentée par add_wall, remove_wall, fill et empty. Le cache est désactivé par défaut
+    et s'active avec `solver_cache.enabled = True` : une modification directe de 'neighbors'
+    ne change pas la version, il faut alors appeler `solver_cache.clear()`.
+
     Attributes:
         height (int): La hauteur du labyrinthe.
         width (int): La largeur du labyrinthe.
-        neighbors (dict): Un dictionnaire représentant les voisins accessibles de chaque cellule du labyrinthe.
+        neighbors (dict | WallBitmap): Un dictionnaire représentant les voisins accessibles de chaque cellule du labyrinthe.
+            Il doit être modifié via add_wall, remove_wall, fill ou empty pour que les caches restent à jour.
+        version (int): Le nombre de modifications des murs depuis la création du labyrinthe.
+        solver_cache (SolverCache): Le cache des résultats des solveurs.
+        distance_cache_size (int): Le nombre maximal de champs de distances gardés en cache.
     """
 
-    def __init__(self, height: int, width: int, empty: bool = False) -> None:
+    def __init__(
+        self, height: int, width: int, empty: bool = False, backend: str = "dict"
+    ) -> None:
         """
         Crée un nouveau labyrinthe avec les dimensions données.
 
@@ -25,32 +268,108 @@ class Maze:
             width (int): La largeur du labyrinthe, en nombre de cellules.
             empty (bool, optional): Indique si le labyrinthe doit être créé sans murs.
                 Par défaut le labyrinthe est créé avec uniquement des murs.
+            backend (str, optional): Le stockage des voisinages, "dict" ou "bitmap".
+                Par défaut un dictionnaire d'ensembles.
 
         Returns:
             None
         """
 
+        assert backend in (
+            "dict",
+            "bitmap",
+        ), f"Stockage inconnu : {backend}, valeurs possibles : 'dict' ou 'bitmap'"
+
         self.height = height
         self.width = width
-        if empty:
-            self.neighbors = {}
-            for i in range(height):
-                for j in range(width):
-                    self.neighbors[(i, j)] = set()
-
-                    if (i + 1) < height:
-                        self.neighbors[(i, j)] |= {(i + 1, j)}
-                    if (j + 1) < width:
-                        self.neighbors[(i, j)] |= {(i, j + 1)}
-                    if (i - 1) > 0:
-                        self.neighbors[(i, j)] |= {(i - 1, j)}
-                    if (j - 1) > 0:
-                        self.neighbors[(i, j)] |= {(i, j - 1)}
+        self.version = 0
+        self.solver_cache = SolverCache(enabled=False)
+        # Champs de distances déjà calculés, par cellule source (cache LRU)
+        self.distance_cache_size = 8
+        self._distance_fields = OrderedDict()
+        # Fonctions prévenues à chaque modification des murs
+        self._listeners = []
+        if backend == "bitmap":
+            self.neighbors = WallBitmap(height, width, empty)
+        elif empty:
+            self.empty()
+            # La construction n'est pas une modification des murs
+            self.version = 0
         else:
             self.neighbors = {
                 (i, j): set() for i in range(height) for j in range(width)
             }
 
+    def __getstate__(self) -> dict:
+        """
+        Retourne l'état à sérialiser, par exemple pour l'envoyer à un autre processus (gen_many, solve_many).
+
+        Les résultats mis en cache et les fonctions enregistrées avec add_listener ne sont pas transmis :
+        ils ne servent à rien dans un autre processus, et une lambda ne peut pas être sérialisée.
+        Seuls les réglages du cache des solveurs sont conservés.
+
+        Returns:
+            dict: Les attributs du labyrinthe, sans les caches ni les fonctions enregistrées.
+        """
+
+        state = self.__dict__.copy()
+        cache = state.pop("solver_cache")
+        state["solver_cache"] = (cache.maxsize, cache.enabled)
+        del state["_distance_fields"]
+        del state["_listeners"]
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restaure un labyrinthe sérialisé, avec des caches vides et aucune fonction enregistrée.
+
+        Args:
+            state (dict): L'état retourné par __getstate__.
+
+        Returns:
+            None
+        """
+
+        maxsize, enabled = state.pop("solver_cache")
+        self.__dict__.update(state)
+        self.solver_cache = SolverCache(maxsize, enabled)
+        self._distance_fields = OrderedDict()
+        self._listeners = []
+
+    @property
+    def backend(self) -> str:
+        """
+        Le stockage actuel des voisinages, "dict" ou "bitmap".
+        """
+
+        return "bitmap" if isinstance(self.neighbors, WallBitmap) else "dict"
+
+    def set_backend(self, backend: str) -> None:
+        """
+        Convertit le stockage des voisinages du labyrinthe.
+
+        Args:
+            backend (str): Le nouveau stockage, "dict" ou "bitmap".
+
+        Returns:
+            None
+        """
+
+        assert backend in (
+            "dict",
+            "bitmap",
+        ), f"Stockage inconnu : {backend}, valeurs possibles : 'dict' ou 'bitmap'"
+
+        if backend == self.backend:
+            return
+        if backend == "bitmap":
+            self.neighbors = WallBitmap.from_dict(
+                self.neighbors, self.height, self.width
+            )
+        else:
+            self.neighbors = self.neighbors.to_dict()
+
     def info(self) -> str:
         """
         Renvoie une chaîne de caractères décrivant le labyrinthe.
@@ -82,6 +401,112 @@ class Maze:
 
         return txt
 
+    def validate(self) -> dict:
+        """
+        Vérifie la cohérence du labyrinthe et retourne un rapport structuré.
+
+        Contrairement à info(), aucune chaîne n'est construite : chaque voisinage est lu une seule fois,
+        et la connexité est obtenue avec une structure union-find sur les passages valides.
+        Avec le stockage "bitmap", les passages sont symétriques et adjacents par construction :
+        on vérifie seulement que la dernière colonne de 'east' et la dernière ligne de 'south'
+        sont vides, par tranches.
+
+        Returns:
+            dict: Le rapport :
+                - 'missing_cells' : les cellules de la grille absentes des voisinages ;
+                - 'extra_cells' : les clés des voisinages hors de la grille ;
+                - 'out_of_bounds' : les couples (cellule, voisine) dont la voisine est hors de la grille ;
+                - 'non_adjacent' : les couples (cellule, voisine) dont les cellules ne se touchent pas ;
+                - 'asymmetric' : les couples (c1, c2) où c2 est voisine de c1 mais pas l'inverse ;
+                - 'passages' : le nombre de passages valides ;
+                - 'components' : le nombre de composantes connexes, par les passages valides ;
+                - 'connected' : indique si toutes les cellules sont reliées ;
+                - 'valid' : indique si aucune anomalie n'a été trouvée ;
+                - 'is_perfect' : indique si le labyrinthe est valide et forme un arbre couvrant.
+        """
+
+        h, w = self.height, self.width
+        n = h * w
+        uf = UnionFind(n)
+        missing = []
+        extra = []
+        out_of_bounds = []
+        non_adjacent = []
+        asymmetric = []
+        passages = 0
+
+        if isinstance(self.neighbors, WallBitmap):
+            east = self.neighbors.east
+            south = self.neighbors.south
+            # Passages vers l'extérieur de la grille : dernière colonne de 'east', dernière ligne de 'south'
+            if w and any(east[w - 1 :: w]):
+                for i in range(h):
+                    if east[i * w + w - 1]:
+                        out_of_bounds.append(((i, w - 1), (i, w)))
+            if any(south[n - w :]):
+                for j in range(w):
+                    if south[n - w + j]:
+                        out_of_bounds.append(((h - 1, j), (h, j)))
+            for k in range(n):
+                if east[k] and (k + 1) % w:
+                    uf.union(k, k + 1)
+                    passages += 1
+                if south[k] and k + w < n:
+                    uf.union(k, k + w)
+                    passages += 1
+        else:
+            neighbors = self.neighbors
+            for i in range(h):
+                for j in range(w):
+                    if (i, j) not in neighbors:
+                        missing.append((i, j))
+
+            for cell, voisins in neighbors.items():
+                try:
+                    i, j = cell
+                    dans_grille = 0 <= i < h and 0 <= j < w
+                except (TypeError, ValueError):
+                    dans_grille = False
+                if not dans_grille:
+                    extra.append(cell)
+                    continue
+
+                for voisin in voisins:
+                    try:
+                        x, y = voisin
+                        dans_grille = 0 <= x < h and 0 <= y < w
+                    except (TypeError, ValueError):
+                        dans_grille = False
+                    if not dans_grille:
+                        out_of_bounds.append((cell, voisin))
+                        continue
+                    if abs(x - i) + abs(y - j) != 1:
+                        non_adjacent.append((cell, voisin))
+                        continue
+                    if cell not in neighbors.get(voisin, ()):
+                        asymmetric.append((cell, voisin))
+                        continue
+                    # Chaque passage valide est vu depuis ses deux cellules : on ne le compte qu'une fois
+                    if cell < voisin:
+                        uf.union(i * w + j, x * w + y)
+                        passages += 1
+
+        valid = not (missing or extra or out_of_bounds or non_adjacent or asymmetric)
+        connected = uf.count <= 1
+
+        return {
+            "missing_cells": missing,
+            "extra_cells": extra,
+            "out_of_bounds": out_of_bounds,
+            "non_adjacent": non_adjacent,
+            "asymmetric": asymmetric,
+            "passages": passages,
+            "components": uf.count,
+            "connected": connected,
+            "valid": valid,
+            "is_perfect": valid and connected and passages == n - 1,
+        }
+
     def __str__(self) -> str:
         """
         Renvoie une représentation textuelle du labyrinthe en utilisant des caractères ascii.
@@ -148,10 +573,15 @@ class Maze:
             and 0 <= c2[1] < self.width
         ), f"Erreur lors de l'ajout d'un mur entre {c1} et {c2} : les coordonnées ne sont pas compatibles avec les dimensions du labyrinthe"
         # Ajout du mur
+        modifie = False
         if c2 in self.neighbors[c1]:  # Si c2 est dans les voisines de c1
             self.neighbors[c1].remove(c2)  # on le retire
+            modifie = True
         if c1 in self.neighbors[c2]:  # Si c3 est dans les voisines de c2
             self.neighbors[c2].remove(c1)  # on le retire
+            modifie = True
+        if modifie:
+            self._changed("add_wall", c1, c2)
 
     def remove_wall(self, c1: tuple, c2: tuple) -> None:
         """
@@ -173,10 +603,64 @@ class Maze:
             and 0 <= c2[1] < self.width
         ), f"Erreur lors de la suppression d'un mur entre {c1} et {c2} : les coordonnées ne sont pas compatibles avec les dimensions du labyrinthe"
         # Ajout du mur
+        modifie = False
         if c2 not in self.neighbors[c1]:  # Si c2 est dans les voisines de c1
             self.neighbors[c1].add(c2)  # on le retire
+            modifie = True
         if c1 not in self.neighbors[c2]:  # Si c3 est dans les voisines de c2
             self.neighbors[c2].add(c1)  # on le retire
+            modifie = True
+        if modifie:
+            self._changed("remove_wall", c1, c2)
+
+    def _changed(self, event: str, c1: tuple = None, c2: tuple = None) -> None:
+        """
+        Invalide les résultats mis en cache suite à une modification des murs,
+        puis prévient les fonctions enregistrées avec add_listener.
+
+        Args:
+            event (str): Le type de modification : "add_wall", "remove_wall", "fill" ou "empty".
+            c1 (tuple, optional): La première cellule du mur modifié, None pour fill et empty.
+            c2 (tuple, optional): La seconde cellule du mur modifié, None pour fill et empty.
+
+        Returns:
+            None
+        """
+
+        self.version += 1
+        if self._distance_fields:
+            self._distance_fields.clear()
+        for callback in self._listeners:
+            callback(event, c1, c2)
+
+    def add_listener(self, callback) -> None:
+        """
+        Enregistre une fonction appelée après chaque modification effective des murs.
+
+        La fonction est appelée avec le type de modification ("add_wall", "remove_wall",
+        "fill" ou "empty") et les deux cellules du mur concerné (None pour fill et empty).
+
+        Args:
+            callback (callable): La fonction à appeler, de la forme callback(event, c1, c2).
+
+        Returns:
+            None
+        """
+
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback) -> None:
+        """
+        Retire une fonction enregistrée avec add_listener.
+
+        Args:
+            callback (callable): La fonction à retirer.
+
+        Returns:
+            None
+        """
+
+        self._listeners.remove(callback)
 
     def get_walls(self) -> list:
         """
@@ -195,8 +679,8 @@ class Maze:
 
             # Si le voisin de droite existe dans le labyrinthe ET qu'il n'est pas dans les voisins de 'cell', faire
             if (
-                voisin_droite[0] < self.width
-                and voisin_droite[1] < self.height
+                voisin_droite[0] < self.height
+                and voisin_droite[1] < self.width
                 and voisin_droite not in self.neighbors[cell]
             ):
 
@@ -205,8 +689,8 @@ class Maze:
 
             # Si le voisin du bas existe dans le labyrinthe ET qu'il n'est pas dans les voisins de 'cell', faire
             if (
-                voisin_bas[0] < self.width
-                and voisin_bas[1] < self.height
+                voisin_bas[0] < self.height
+                and voisin_bas[1] < self.width
                 and voisin_bas not in self.neighbors[cell]
             ):
 
@@ -225,8 +709,13 @@ class Maze:
             None
         """
 
-        for cell in self.neighbors:
-            self.neighbors[cell] = set()
+        if isinstance(self.neighbors, WallBitmap):
+            self.neighbors.fill()
+        else:
+            for cell in self.neighbors:
+                self.neighbors[cell] = set()
+
+        self._changed("fill")
 
     def empty(self) -> None:
         """
@@ -238,6 +727,11 @@ class Maze:
             None
         """
 
+        if isinstance(getattr(self, "neighbors", None), WallBitmap):
+            self.neighbors.empty()
+            self._changed("empty")
+            return
+
         self.neighbors = {}
 
         for i in range(self.height):
@@ -248,11 +742,37 @@ class Maze:
                     self.neighbors[(i, j)] |= {(i + 1, j)}
                 if (j + 1) < self.width:
                     self.neighbors[(i, j)] |= {(i, j + 1)}
-                if (i - 1) > 0:
+                if (i - 1) >= 0:
                     self.neighbors[(i, j)] |= {(i - 1, j)}
-                if (j - 1) > 0:
+                if (j - 1) >= 0:
                     self.neighbors[(i, j)] |= {(i, j - 1)}
 
+        self._changed("empty")
+
+    def connectivity(self) -> UnionFind:
+        """
+        Retourne les composantes connexes du labyrinthe sous forme d'une structure union-find.
+
+        La cellule (i, j) y est représentée par l'entier i * width + j.
+
+        Returns:
+            UnionFind: Les ensembles de cellules reliées entre elles par un chemin.
+        """
+
+        return UnionFind.from_maze(self)
+
+    def junction_graph(self) -> JunctionGraph:
+        """
+        Retourne le graphe des carrefours et impasses du labyrinthe, reliés par la longueur des couloirs.
+
+        Les requêtes répétées sur un même labyrinthe y sont plus rapides que cellule par cellule.
+
+        Returns:
+            JunctionGraph: Le graphe compressé, valable tant que les murs ne sont pas modifiés.
+        """
+
+        return JunctionGraph(self)
+
     def get_contiguous_cells(self, cell: tuple) -> list:
         """
         Retourne la liste des cellules adjacentes à la cellule donnée.
@@ -301,18 +821,23 @@ class Maze:
         return reachable
 
     @classmethod
-    def gen_btree(cls, h: int, w: int) -> Maze:
+    def gen_btree(cls, h: int, w: int, rng=None) -> Maze:
         """
         Construit un labyrinthe vide en utilisant la génération par arbre binaire.
 
         Args:
             h (int): Hauteur du labyrinthe.
             w (int): Largeur du labyrinthe.
+            rng (optional): Le générateur aléatoire, par exemple un random.Random ou un BulkRandom.
+                Par défaut le module random.
 
         Returns:
             Maze: Une instance de la classe Maze représentant le labyrinthe.
         """
 
+        if rng is None:
+            rng = random
+
         lab = cls(h, w, False)
 
         # Parcours de toutes les cellules du layrinthe
@@ -325,7 +850,7 @@ class Maze:
                 # Si la cellule 'EST' ET la cellule 'SUD' existe dans les voisins contigues de (i,j)
                 if voisin_est in contiguous_cells and voisin_sud in contiguous_cells:
                     # On supprime au hasard le mur 'EST' ou 'SUD' entre la cellule (i,j) et sa voisine
-                    lab.remove_wall((i, j), choice((voisin_est, voisin_sud)))
+                    lab.remove_wall((i, j), rng.choice((voisin_est, voisin_sud)))
 
                 # Si la cellule 'EST' existe dans les voisins contigues de (i,j) ET la cellule 'SUD' n'j existe pas
                 elif (
@@ -346,18 +871,23 @@ class Maze:
         return lab
 
     @classmethod
-    def gen_sidewinder(cls, h: int, w: int) -> Maze:
+    def gen_sidewinder(cls, h: int, w: int, rng=None) -> Maze:
         """
         Construit un labyrinthe vide en utilisant la génération par sidewinder.
 
         Args:
             h (int): Hauteur du labyrinthe.
             w (int): Largeur du labyrinthe.
+            rng (optional): Le générateur aléatoire, par exemple un random.Random ou un BulkRandom.
+                Par défaut le module random.
 
         Returns:
             Maze: Une instance de la classe Maze représentant le labyrinthe.
         """
 
+        if rng is None:
+            rng = random
+
         # Initialisation d’un labyrinthe plein
         lab = cls(h, w, False)
 
@@ -369,7 +899,7 @@ class Maze:
                 # Ajouter la cellule (i, j) à la séquence
                 sequence.append((i, j))
                 # Tirer à pile ou face
-                pile_face = choice(["pile", "face"])
+                pile_face = rng.choice(["pile", "face"])
 
                 # Si c’est pile
                 if pile_face == "pile":
@@ -379,16 +909,16 @@ class Maze:
                 # Si c’est face :
                 if pile_face == "face":
                     # Casser le mur SUD d’une des cellules, au hasard, présente dans la liste 'sequence'.
-                    rand_cell = choice(sequence)
+                    rand_cell = rng.choice(sequence)
                     lab.remove_wall(rand_cell, (rand_cell[0] + 1, rand_cell[1]))
                     # Réinitialiser 'sequence' à une liste vide
                     sequence = []
 
             # Ajouter la dernière cellule à la séquence
-            sequence.append((i, j))
+            sequence.append((i, w - 1))
 
             # Tirer une cellule au sort dans la séquence et casser son mur SUD
-            rand_cell = choice(sequence)
+            rand_cell = rng.choice(sequence)
             lab.remove_wall(rand_cell, (rand_cell[0] + 1, rand_cell[1]))
 
         # Casser tous les murs EST de la dernière ligne
@@ -398,18 +928,125 @@ class Maze:
         return lab
 
     @classmethod
-    def gen_fusion(cls, h: int, w: int) -> Maze:
+    def gen_btree_fast(
+        cls, h: int, w: int, backend: str = "bitmap", rng=None
+    ) -> Maze:
+        """
+        Construit un labyrinthe par arbre binaire en écrivant directement dans les tableaux de passages.
+
+        Tous les tirages sont faits en une fois, puis les passages sont écrits par tranches,
+        sans appel à remove_wall. Les labyrinthes obtenus suivent la même distribution que gen_btree.
+
+        Args:
+            h (int): Hauteur du labyrinthe.
+            w (int): Largeur du labyrinthe.
+            backend (str, optional): Le stockage des voisinages, "dict" ou "bitmap". Par défaut "bitmap".
+            rng (optional): Le générateur aléatoire, par exemple un random.Random ou un BulkRandom.
+                Par défaut le module random.
+
+        Returns:
+            Maze: Une instance de la classe Maze représentant le labyrinthe.
+        """
+
+        if rng is None:
+            rng = random
+
+        # Initialisation d’un labyrinthe plein
+        lab = cls(h, w, False, backend="bitmap")
+        if h * w == 0:
+            return lab
+        east = lab.neighbors.east
+        south = lab.neighbors.south
+
+        # Pile ou face pour chaque cellule : 1 casse le mur EST, 0 casse le mur SUD
+        tirages = _random_bits(h * w, rng)
+        east[:] = tirages
+        south[:] = tirages.translate(bytes.maketrans(b"\x00\x01", b"\x01\x00"))
+
+        # Dernière colonne : seul le mur SUD peut être cassé
+        east[w - 1 :: w] = bytes(h)
+        south[w - 1 :: w] = b"\x01" * h
+
+        # Dernière ligne : seul le mur EST peut être cassé
+        east[(h - 1) * w :] = b"\x01" * (w - 1) + b"\x00"
+        south[(h - 1) * w :] = bytes(w)
+
+        lab.set_backend(backend)
+
+        return lab
+
+    @classmethod
+    def gen_sidewinder_fast(
+        cls, h: int, w: int, backend: str = "bitmap", rng=None
+    ) -> Maze:
+        """
+        Construit un labyrinthe par sidewinder en écrivant directement dans les tableaux de passages.
+
+        Les tirages à pile ou face de toute la grille sont faits en une fois.
+        Les murs EST sont écrits ligne par ligne, puis une cellule est tirée dans chaque séquence
+        pour casser son mur SUD. Les labyrinthes obtenus suivent la même distribution que gen_sidewinder.
+
+        Args:
+            h (int): Hauteur du labyrinthe.
+            w (int): Largeur du labyrinthe.
+            backend (str, optional): Le stockage des voisinages, "dict" ou "bitmap". Par défaut "bitmap".
+            rng (optional): Le générateur aléatoire, par exemple un random.Random ou un BulkRandom.
+                Par défaut le module random.
+
+        Returns:
+            Maze: Une instance de la classe Maze représentant le labyrinthe.
+        """
+
+        if rng is None:
+            rng = random
+
+        # Initialisation d’un labyrinthe plein
+        lab = cls(h, w, False, backend="bitmap")
+        if h * w == 0:
+            return lab
+        east = lab.neighbors.east
+        south = lab.neighbors.south
+
+        # Pile (1) ou face (0) pour chaque cellule, sauf la dernière colonne qui termine toujours la séquence
+        tirages = bytearray(_random_bits((h - 1) * w, rng))
+        tirages[w - 1 :: w] = bytes(h - 1)
+
+        # Pile : on casse le mur EST
+        east[: (h - 1) * w] = tirages
+
+        # Face : la séquence se termine, on casse le mur SUD d'une de ses cellules au hasard
+        debut = 0
+        fin = tirages.find(0)
+        while fin != -1:
+            south[rng.randrange(debut, fin + 1)] = 1
+            debut = fin + 1
+            fin = tirages.find(0, debut)
+
+        # Casser tous les murs EST de la dernière ligne
+        east[(h - 1) * w :] = b"\x01" * (w - 1) + b"\x00"
+
+        lab.set_backend(backend)
+
+        return lab
+
+    @classmethod
+    def gen_fusion(cls, h: int, w: int, rng=None) -> Maze:
         """
         Construit un labyrinthe vide en utilisant la génération par fusion de chemins.
 
         Args:
             h (int): Hauteur du labyrinthe.
             w (int): Largeur du labyrinthe.
+            rng (optional): Le générateur aléatoire, par exemple un random.Random ou un BulkRandom.
+                Par défaut le module random.
 
         Returns:
             Maze: Une instance de la classe Maze représentant le labyrinthe.
         """
 
+        if rng is None:
+            rng = random
+
         # Initialisation d’un labyrinthe plein
         lab = cls(h, w, False)
 
@@ -417,56 +1054,56 @@ class Maze:
         # Pour représenter chaque cellule dans une liste,
         # on peut simplement la numéroter de gauche à droite et de haut en bas.
         # Cela signifie que la cellule (i, j) sera représentée dans la liste par i * w + j.
-        labels = list(range(h * w))
+        # Les labels sont gérés par une structure union-find :
+        # deux cellules ont le même label si elles ont le même représentant.
+        labels = UnionFind(h * w)
 
         # On extrait la liste de tous les murs mélangés
         lst_mur = lab.get_walls()
-        shuffle(lst_mur)
+        rng.shuffle(lst_mur)
 
         # Pour chaque mur de la liste
         for mur in lst_mur:
-            # Si les deux cellules séparées par le mur n’ont pas le même label
             x1, y1 = mur[0]
             x2, y2 = mur[1]
             # w = largeur du labyrinthe (nombre de cellules par ligne)
             # x * w = index de la première cellule dans la ligne x de la liste
             # x * w + y = index de la cellule (x, y) dans la liste
-            if labels[x1 * w + y1] != labels[x2 * w + y2]:
+            # Si les deux cellules séparées par le mur n’ont pas le même label,
+            # on fusionne leurs labels
+            if labels.union(x1 * w + y1, x2 * w + y2):
                 # Casse le mur
                 lab.remove_wall(mur[0], mur[1])
 
-                # Affecte le label de la première cellule à toutes les cellules ayant le même label que la seconde cellule
-                old_label = labels[x2 * w + y2]
-                new_label = labels[x1 * w + y1]
-                for i in range(h):
-                    for j in range(w):
-                        if labels[i * w + j] == old_label:
-                            labels[i * w + j] = new_label
-
         return lab
 
     @classmethod
-    def gen_exploration(cls, h: int, w: int) -> Maze:
+    def gen_exploration(cls, h: int, w: int, rng=None) -> Maze:
         """
         Construit un labyrinthe vide en utilisant la génération par exploration.
 
         Args:
             h (int): Hauteur du labyrinthe.
             w (int): Largeur du labyrinthe.
+            rng (optional): Le générateur aléatoire, par exemple un random.Random ou un BulkRandom.
+                Par défaut le module random.
 
         Returns:
             Maze: Une instance de la classe Maze représentant le labyrinthe.
         """
 
+        if rng is None:
+            rng = random
+
         # Initialisation d’un labyrinthe plein
         lab = cls(h, w, False)
 
         # Choisir une cellule au hasard
-        x = randint(0, w - 1)
-        y = randint(0, h - 1)
+        x = rng.randint(0, w - 1)
+        y = rng.randint(0, h - 1)
 
         # Marquer cette cellule comme étant visitée
-        cell_visited = set((y, x))
+        cell_visited = {(y, x)}
 
         # Mettre cette cellule sur une pile
         pile = [(y, x)]
@@ -489,7 +1126,7 @@ class Maze:
                 # La remettre sur la pile
                 pile.append(cellule)
                 # Choisir au hasard l’une de ses cellules contigües qui n’a pas été visitée
-                rand_cell = choice(cell_not_visited)
+                rand_cell = rng.choice(cell_not_visited)
                 # Casser le mur entre la cellule et celle qui vient d’être choisie
                 lab.remove_wall(cellule, rand_cell)
                 # Marquer la cellule qui vient d’être choisie comme visitée
@@ -500,130 +1137,767 @@ class Maze:
         return lab
 
     @classmethod
-    def gen_wilson(cls, h: int, w: int) -> Maze:
+    def gen_exploration_fast(
+        cls, h: int, w: int, backend: str = "bitmap", rng=None
+    ) -> Maze:
+        """
+        Construit un labyrinthe par exploration en travaillant sur des index entiers.
+
+        Même parcours en profondeur aléatoire que gen_exploration, sans allocation par cellule :
+        la grille est entourée d'une bordure de cellules déjà visitées, ce qui permet de numéroter
+        les cellules par des entiers et de trouver leurs voisines par simple décalage
+        (-W, +W, -1, +1 avec W = w + 2) sans test de bord. Les cellules visitées et les passages
+        sont stockés dans des tableaux d'octets, recopiés ligne par ligne dans un WallBitmap à la fin.
+
+        Args:
+            h (int): Hauteur du labyrinthe.
+            w (int): Largeur du labyrinthe.
+            backend (str, optional): Le stockage des voisinages, "dict" ou "bitmap". Par défaut "bitmap".
+            rng (optional): Le générateur aléatoire, par exemple un random.Random ou un BulkRandom.
+                Par défaut le module random.
+
+        Returns:
+            Maze: Une instance de la classe Maze représentant le labyrinthe.
+        """
+
+        if rng is None:
+            rng = random
+
+        # Initialisation d’un labyrinthe plein
+        lab = cls(h, w, False, backend="bitmap")
+        if h * w == 0:
+            return lab
+
+        # Grille entourée d'une bordure : seules les cellules intérieures sont non-visitées
+        W = w + 2
+        visited = bytearray(b"\x01") * (W * (h + 2))
+        for i in range(1, h + 1):
+            visited[i * W + 1 : i * W + 1 + w] = bytes(w)
+        east = bytearray(W * (h + 2))
+        south = bytearray(W * (h + 2))
+
+        # Choisir une cellule au hasard, la marquer et la mettre sur la pile
+        x = rng.randint(0, w - 1)
+        y = rng.randint(0, h - 1)
+        k = (y + 1) * W + x + 1
+        visited[k] = 1
+        pile = [k]
+        alea = rng.random
+
+        # Tant que la pile n’est pas vide
+        while pile:
+
+            # On regarde la cellule en haut de la pile et ses voisines nord, sud, ouest et est
+            k = pile[-1]
+            nord = visited[k - W]
+            sud = visited[k + W]
+            ouest = visited[k - 1]
+            libres = 3 - nord - sud - ouest + (not visited[k + 1])
+
+            # Si toutes ses voisines ont été visitées, on la retire de la pile
+            if not libres:
+                pile.pop()
+                continue
+
+            # Choisir au hasard l’une de ses cellules contigües qui n’a pas été visitée,
+            # casser le mur entre les deux cellules, marquer la cellule choisie et la mettre sur la pile
+            rang = int(alea() * libres)
+            if not nord:
+                if not rang:
+                    v = k - W
+                    south[v] = 1
+                    visited[v] = 1
+                    pile.append(v)
+                    continue
+                rang -= 1
+            if not sud:
+                if not rang:
+                    v = k + W
+                    south[k] = 1
+                    visited[v] = 1
+                    pile.append(v)
+                    continue
+                rang -= 1
+            if not ouest and not rang:
+                v = k - 1
+                east[v] = 1
+                visited[v] = 1
+                pile.append(v)
+                continue
+            v = k + 1
+            east[k] = 1
+            visited[v] = 1
+            pile.append(v)
+
+        # Recopie des passages sans la bordure
+        for i in range(h):
+            k = (i + 1) * W + 1
+            lab.neighbors.east[i * w : (i + 1) * w] = east[k : k + w]
+            lab.neighbors.south[i * w : (i + 1) * w] = south[k : k + w]
+
+        lab.set_backend(backend)
+
+        return lab
+
+    @classmethod
+    def gen_wilson(cls, h: int, w: int, rng=None) -> Maze:
         """
         Construit un labyrinthe vide en utilisant la génération par algorithme de Wilson.
 
         Args:
             h (int): Hauteur du labyrinthe.
             w (int): Largeur du labyrinthe.
+            rng (optional): Le générateur aléatoire, par exemple un random.Random ou un BulkRandom.
+                Par défaut le module random.
 
         Returns:
             Maze: Une instance de la classe Maze représentant le labyrinthe.
         """
 
+        if rng is None:
+            rng = random
+
         # Initialisation d’un labyrinthe plein
         lab = cls(h, w, False)
 
-        # Création d'une liste de toutes les cellules
+        # Création d'une liste de toutes les cellules, dans un ordre aléatoire.
+        # L'ordre dans lequel on choisit les cellules de départ des marches
+        # ne change pas la distribution (uniforme) des labyrinthes obtenus.
         cell_unvisited = [(i, j) for i in range(h) for j in range(w)]
+        rng.shuffle(cell_unvisited)
+
+        # Cellules contigües de chaque cellule, calculées une seule fois
+        contigues = {cell: lab.get_contiguous_cells(cell) for cell in cell_unvisited}
 
-        # Choisir une cellule au hasard sur la grille
-        rand_cell = choice(cell_unvisited)
-        # Retirer la cellule choisie de la liste des cellules non-visitées
-        cell_unvisited.remove(rand_cell)
-        # Marquer cette cellule
-        cell_visited = [rand_cell]
+        # Choisir une cellule au hasard sur la grille et la marquer
+        cell_visited = {cell_unvisited.pop()}
 
         # Tant qu’il reste des cellules non marquées
         while cell_unvisited:
 
             # Choisir une cellule de départ au hasard, parmi les cellules non marquées
-            head = choice(cell_unvisited)
+            start = cell_unvisited.pop()
+            if start in cell_visited:
+                continue
 
-            # Effectuer une marche aléatoire jusqu'à ce qu'une cellule marquée soit atteinte
-            # Initialisation d'une marche aux positions de la cellule de départ
-            marche = [head]
+            # Effectuer une marche aléatoire jusqu'à ce qu'une cellule marquée soit atteinte.
+            # On ne retient que la dernière direction de sortie de chaque cellule :
+            # revenir sur une cellule écrase sa sortie précédente, ce qui efface la boucle.
+            sortie = {}
+            head = start
 
             # Tant que la cellule actuelle n'est pas marquée
             while head not in cell_visited:
 
-                # Choisir un voisin aléatoirement dans les voisins de la cellule,
-                # l'ajouter dans la marche, puis le définir comme cellule actuelle
-                voisin = choice(lab.get_contiguous_cells(head))
-                marche.append(voisin)
+                # Choisir un voisin aléatoirement dans les voisins de la cellule
+                voisin = rng.choice(contigues[head])
+                sortie[head] = voisin
                 head = voisin
 
-                # Si la tête du serpent se trouve dans le corps,
-                # supprimer toutes les cellules visitées depuis le dernier passage sur la cellule courante
-                if head in marche[:-1]:
-                    marche = marche[: marche.index(head) + 1]
-
-            # Pour chaque cellule dans la 'marche', on la retire des cellules non-visitées et
-            # l'ajoute aux cellules visitées, enfin supprimer le mur entre la cellule[i] et la cellule[i+1] de la marche
-            for i in range(len(marche) - 1):
-
-                cell_unvisited.remove(marche[i])
-                cell_visited.append(marche[i])
-                lab.remove_wall(marche[i], marche[i + 1])
+            # On refait la marche sans boucle depuis la cellule de départ :
+            # chaque cellule est marquée et le mur vers sa sortie est supprimé
+            head = start
+            while head not in cell_visited:
+                cell_visited.add(head)
+                lab.remove_wall(head, sortie[head])
+                head = sortie[head]
 
         return lab
 
-    def overlay(self, content: dict = {}) -> str:
+    @classmethod
+    def gen_division(cls, h: int, w: int, backend: str = "dict", rng=None) -> Maze:
         """
-        Renvoie une représentation textuelle du labyrinthe avec du contenu dans les cellules en utilisant des caractères ascii.
+        Construit un labyrinthe en utilisant la génération par division récursive.
 
-        Args:
-            content (dict, optional): Un dictionnaire où chaque clé est une cellule et chaque valeur est le contenu de la cellule.
-                Le contenu est représenté par un caractère.
-                Par défaut le dictionnaire est vide.
+        On part d'un labyrinthe vide que l'on coupe par une ligne de murs percée d'une seule ouverture,
+        puis on recommence dans chacune des deux parties. Les régions à traiter sont gardées sur une pile
+        (pas de récursion), et chaque ligne de murs est écrite d'un coup par tranche dans les tableaux de passages.
 
-        Returns:
-            str: Le labyrinthe représenté sous forme de chaîne de caractères.
+        Args:
+            h (int): Hauteur du labyrinthe.
+            w (int): Largeur du labyrinthe.
+            backend (str, optional): Le stockage des voisinages, "dict" ou "bitmap".
+                Par défaut "dict", comme les autres générations ; "bitmap" évite la conversion finale.
+            rng (optional): Le générateur aléatoire, par exemple un random.Random ou un BulkRandom.
+                Par défaut le module random.
+
+        Returns:
+            Maze: Une instance de la classe Maze représentant le labyrinthe.
         """
 
-        if not content:
-            content = {
-                (i, j): " " for i in range(self.height) for j in range(self.width)
-            }
-        else:
-            c = {
-                (i, j): " "
-                for i in range(self.height)
-                for j in range(self.width)
-                if (i, j) not in content
-            }
-            content = {**content, **c}
-        txt = r""
-        # Première ligne
-        txt += "┏"
-        for j in range(self.width - 1):
-            txt += "━━━┳"
-        txt += "━━━┓\n"
-        txt += "┃"
-        for j in range(self.width - 1):
-            txt += (
-                " " + content[(0, j)] + " ┃"
-                if (0, j + 1) not in self.neighbors[(0, j)]
-                else " " + content[(0, j)] + "  "
-            )
-        txt += " " + content[(0, self.width - 1)] + " ┃\n"
-        # Lignes normales
-        for i in range(self.height - 1):
-            txt += "┣"
-            for j in range(self.width - 1):
-                txt += "━━━╋" if (i + 1, j) not in self.neighbors[(i, j)] else "   ╋"
-            txt += (
-                "━━━┫\n"
-                if (i + 1, self.width - 1) not in self.neighbors[(i, self.width - 1)]
-                else "   ┫\n"
-            )
-            txt += "┃"
-            for j in range(self.width):
-                txt += (
-                    " " + content[(i + 1, j)] + " ┃"
-                    if (i + 1, j + 1) not in self.neighbors[(i + 1, j)]
-                    else " " + content[(i + 1, j)] + "  "
+        if rng is None:
+            rng = random
+
+        # Initialisation d’un labyrinthe vide
+        lab = cls(h, w, True, backend="bitmap")
+        east = lab.neighbors.east
+        south = lab.neighbors.south
+
+        # Pile des régions à diviser : (ligne, colonne, hauteur, largeur)
+        pile = [(0, 0, h, w)]
+        while pile:
+            r0, c0, hauteur, largeur = pile.pop()
+            if hauteur < 2 or largeur < 2:
+                continue
+
+            # On coupe perpendiculairement à la plus grande dimension (au hasard si la région est carrée)
+            if hauteur > largeur or (hauteur == largeur and rng.randint(0, 1)):
+                # Ligne de murs horizontale sous la ligne r, percée en colonne 'porte'
+                r = rng.randrange(r0, r0 + hauteur - 1)
+                porte = rng.randrange(c0, c0 + largeur)
+                k = r * w
+                south[k + c0 : k + c0 + largeur] = bytes(largeur)
+                south[k + porte] = 1
+                pile.append((r0, c0, r - r0 + 1, largeur))
+                pile.append((r + 1, c0, r0 + hauteur - r - 1, largeur))
+            else:
+                # Ligne de murs verticale à droite de la colonne c, percée en ligne 'porte'
+                c = rng.randrange(c0, c0 + largeur - 1)
+                porte = rng.randrange(r0, r0 + hauteur)
+                east[r0 * w + c : (r0 + hauteur) * w + c : w] = bytes(hauteur)
+                east[porte * w + c] = 1
+                pile.append((r0, c0, hauteur, c - c0 + 1))
+                pile.append((r0, c + 1, hauteur, c0 + largeur - c - 1))
+
+        lab.set_backend(backend)
+
+        return lab
+
+    @classmethod
+    def gen_many(
+        cls,
+        algorithm: str,
+        n: int,
+        h: int,
+        w: int,
+        workers: int = 1,
+        seed: int = None,
+    ) -> list:
+        """
+        Génère un grand nombre de labyrinthes en répartissant le travail sur plusieurs processus.
+
+        Chaque labyrinthe reçoit sa propre graine, tirée à partir de 'seed' :
+        à graine fixée, le résultat est identique quel que soit le nombre de processus.
+        Les labyrinthes sont retournés avec le stockage "bitmap", peu coûteux à transférer entre processus.
+
+        Args:
+            algorithm (str): Le nom de la méthode de génération, par exemple "wilson" ou "gen_wilson".
+            n (int): Le nombre de labyrinthes à générer.
+            h (int): Hauteur des labyrinthes.
+            w (int): Largeur des labyrinthes.
+            workers (int, optional): Le nombre de processus. Par défaut 1, c'est-à-dire dans le processus courant.
+                Avec None, le nombre de cœurs de la machine.
+            seed (int, optional): La graine globale. Par défaut une graine aléatoire.
+
+        Returns:
+            list: La liste des n labyrinthes générés.
+        """
+
+        methode = algorithm if algorithm.startswith("gen_") else "gen_" + algorithm
+        assert hasattr(
+            cls, methode
+        ), f"Méthode de génération inconnue : {algorithm}"
+
+        # Une graine par labyrinthe, dérivée de la graine globale
+        tirage = random.Random(seed)
+        tasks = [(methode, h, w, tirage.getrandbits(64)) for _ in range(n)]
+
+        return _pool_map(_gen_one, tasks, workers)
+
+    @classmethod
+    def gen_tiled(
+        cls,
+        algorithm: str,
+        h: int,
+        w: int,
+        tile: int = 256,
+        workers: int = 1,
+        seed: int = None,
+        backend: str = "bitmap",
+    ) -> Maze:
+        """
+        Construit un grand labyrinthe parfait en générant ses tuiles en parallèle.
+
+        La grille est découpée en tuiles d'au plus tile x tile cellules,
+        chacune générée dans un processus séparé avec la méthode de génération choisie.
+        Les tuiles sont ensuite reliées entre elles : on tire un arbre couvrant aléatoire
+        du graphe des tuiles (par fusion, comme gen_fusion), et pour chacune de ses arêtes
+        on casse un seul mur, au hasard, sur la frontière entre les deux tuiles.
+        Chaque tuile étant un arbre, le labyrinthe obtenu est un arbre couvrant de toute la grille.
+
+        Args:
+            algorithm (str): Le nom de la méthode de génération des tuiles, par exemple "wilson" ou "gen_wilson".
+            h (int): Hauteur du labyrinthe.
+            w (int): Largeur du labyrinthe.
+            tile (int, optional): La taille maximale du côté d'une tuile. Par défaut 256.
+            workers (int, optional): Le nombre de processus. Par défaut 1, c'est-à-dire dans le processus courant.
+                Avec None, le nombre de cœurs de la machine.
+            seed (int, optional): La graine globale. Par défaut une graine aléatoire.
+            backend (str, optional): Le stockage des voisinages, "dict" ou "bitmap". Par défaut "bitmap".
+
+        Returns:
+            Maze: Une instance de la classe Maze représentant le labyrinthe.
+        """
+
+        methode = algorithm if algorithm.startswith("gen_") else "gen_" + algorithm
+        assert hasattr(
+            cls, methode
+        ), f"Méthode de génération inconnue : {algorithm}"
+        assert tile > 0, f"Taille de tuile invalide : {tile}"
+
+        # Découpage de la grille : origine et taille des tuiles, ligne par ligne et colonne par colonne
+        lignes = [(r, min(tile, h - r)) for r in range(0, h, tile)]
+        colonnes = [(c, min(tile, w - c)) for c in range(0, w, tile)]
+
+        # Une graine par tuile, dérivée de la graine globale
+        tirage = random.Random(seed)
+        tasks = [
+            (methode, th, tw, tirage.getrandbits(64))
+            for _, th in lignes
+            for _, tw in colonnes
+        ]
+        tuiles = _pool_map(_gen_one, tasks, workers)
+
+        # Copie de chaque tuile, ligne par ligne, dans les tableaux de passages du labyrinthe
+        lab = cls(h, w, False, backend="bitmap")
+        east = lab.neighbors.east
+        south = lab.neighbors.south
+        nc = len(colonnes)
+        for ti, (r0, th) in enumerate(lignes):
+            for tj, (c0, tw) in enumerate(colonnes):
+                t = tuiles[ti * nc + tj].neighbors
+                for r in range(th):
+                    k = (r0 + r) * w + c0
+                    east[k : k + tw] = t.east[r * tw : (r + 1) * tw]
+                    south[k : k + tw] = t.south[r * tw : (r + 1) * tw]
+
+        # Liste des frontières entre tuiles voisines, mélangées
+        frontieres = []
+        for ti in range(len(lignes)):
+            for tj in range(nc):
+                if tj + 1 < nc:
+                    frontieres.append((ti, tj, ti, tj + 1))
+                if ti + 1 < len(lignes):
+                    frontieres.append((ti, tj, ti + 1, tj))
+        tirage.shuffle(frontieres)
+
+        # Arbre couvrant des tuiles : on ouvre une frontière si elle relie deux groupes de tuiles distincts
+        groupes = UnionFind(len(lignes) * nc)
+        for ti, tj, ui, uj in frontieres:
+            if groupes.union(ti * nc + tj, ui * nc + uj):
+                r0, th = lignes[ti]
+                c0, tw = colonnes[tj]
+                if ui == ti:
+                    # Frontière verticale : on casse le mur EST d'une cellule de la dernière colonne de la tuile
+                    r = tirage.randrange(r0, r0 + th)
+                    east[r * w + c0 + tw - 1] = 1
+                else:
+                    # Frontière horizontale : on casse le mur SUD d'une cellule de la dernière ligne de la tuile
+                    c = tirage.randrange(c0, c0 + tw)
+                    south[(r0 + th - 1) * w + c] = 1
+
+        lab.set_backend(backend)
+
+        return lab
+
+    @classmethod
+    def stream_eller(cls, h: int, w: int, rng=None):
+        """
+        Génère un labyrinthe ligne par ligne selon l'algorithme d'Eller.
+
+        Seul l'état de la ligne courante est conservé (mémoire en O(w)),
+        ce qui permet de produire des labyrinthes de hauteur quelconque, voire infinie.
+
+        Chaque ligne est représentée par deux tableaux d'octets de taille w :
+        'east[j]' vaut 1 si le passage entre (i, j) et (i, j + 1) est ouvert,
+        'south[j]' vaut 1 si le passage entre (i, j) et (i + 1, j) est ouvert.
+
+        Args:
+            h (int): Hauteur du labyrinthe, ou None pour une génération qui ne s'arrête jamais.
+            w (int): Largeur du labyrinthe.
+            rng (optional): Le générateur aléatoire, par exemple un random.Random ou un BulkRandom.
+                Par défaut le module random.
+
+        Yields:
+            tuple: Un couple (east, south) de bytes décrivant les passages de la ligne.
+        """
+
+        if rng is None:
+            rng = random
+
+        # Label de l'ensemble de chaque cellule de la ligne courante (None si pas encore affectée)
+        labels = [None] * w
+        next_label = 0
+
+        for i in count() if h is None else range(h):
+            derniere = h is not None and i == h - 1
+
+            # Chaque cellule sans ensemble reçoit un nouvel ensemble
+            for j in range(w):
+                if labels[j] is None:
+                    labels[j] = next_label
+                    next_label += 1
+
+            # Colonnes de chaque ensemble présent dans la ligne
+            membres = {}
+            for j, label in enumerate(labels):
+                membres.setdefault(label, []).append(j)
+
+            # Fusion aléatoire de cellules voisines appartenant à des ensembles différents
+            # (sur la dernière ligne, on les fusionne toutes)
+            east = bytearray(w)
+            for j in range(w - 1):
+                a, b = labels[j], labels[j + 1]
+                if a != b and (derniere or rng.randint(0, 1)):
+                    east[j] = 1
+                    # On renomme le plus petit ensemble
+                    if len(membres[a]) < len(membres[b]):
+                        a, b = b, a
+                    for k in membres[b]:
+                        labels[k] = a
+                    membres[a].extend(membres.pop(b))
+
+            # Chaque ensemble ouvre au moins un passage vers le sud,
+            # les cellules qui descendent conservent leur ensemble
+            south = bytearray(w)
+            suivants = [None] * w
+            if not derniere:
+                for label, colonnes in membres.items():
+                    obligatoire = rng.choice(colonnes)
+                    for k in colonnes:
+                        if k == obligatoire or rng.randint(0, 1):
+                            south[k] = 1
+                            suivants[k] = label
+
+            yield bytes(east), bytes(south)
+            labels = suivants
+
+    @classmethod
+    def gen_eller(cls, h: int, w: int, backend: str = "dict", rng=None) -> Maze:
+        """
+        Construit un labyrinthe vide en utilisant la génération par algorithme d'Eller.
+
+        Args:
+            h (int): Hauteur du labyrinthe.
+            w (int): Largeur du labyrinthe.
+            backend (str, optional): Le stockage des voisinages, "dict" ou "bitmap". Par défaut "dict".
+            rng (optional): Le générateur aléatoire, par exemple un random.Random ou un BulkRandom.
+                Par défaut le module random.
+
+        Returns:
+            Maze: Une instance de la classe Maze représentant le labyrinthe.
+        """
+
+        if rng is None:
+            rng = random
+
+        # Initialisation d’un labyrinthe plein
+        lab = cls(h, w, False, backend="bitmap")
+
+        # Chaque ligne générée est copiée directement dans les tableaux de passages
+        for i, (east, south) in enumerate(cls.stream_eller(h, w, rng)):
+            lab.neighbors.east[i * w : (i + 1) * w] = east
+            lab.neighbors.south[i * w : (i + 1) * w] = south
+
+        lab.set_backend(backend)
+
+        return lab
+
+    @staticmethod
+    def render_stream(rows, content: dict = None):
+        """
+        Produit la représentation textuelle d'un labyrinthe ligne par ligne.
+
+        Les lignes produites sont identiques à celles de __str__ (ou de overlay si 'content' est donné),
+        mais seules deux lignes du labyrinthe sont conservées en mémoire.
+        Chaque ligne de texte est construite d'un bloc à partir des octets de passages ;
+        le contenu n'est inséré que dans les lignes où il y en a.
+
+        Args:
+            rows (iterable): Les lignes du labyrinthe sous forme de couples (east, south),
+                comme celles produites par stream_eller.
+            content (dict, optional): Un dictionnaire associant à des cellules (i, j) leur contenu,
+                comme pour overlay. Par défaut aucun contenu.
+
+        Yields:
+            str: Une ligne de texte, terminée par un retour à la ligne.
+        """
+
+        # Contenu regroupé par ligne, sans parcourir les cellules vides
+        par_ligne = {}
+        for (i, j), c in (content or {}).items():
+            par_ligne.setdefault(i, []).append((j, c))
+
+        precedente = None
+        w = 0
+        for i, (east, south) in enumerate(rows):
+            if precedente is None:
+                # Première ligne
+                w = len(east)
+                yield "┏" + "━━━┳" * (w - 1) + "━━━┓\n"
+            else:
+                # Séparation avec la ligne précédente
+                sud = precedente[1]
+                yield (
+                    "┣"
+                    + _pieces(sud[: w - 1], "━━━╋", "   ╋")
+                    + ("   ┫\n" if sud[w - 1] else "━━━┫\n")
                 )
-            txt += "\n"
+            ligne = "┃" + _pieces(east[: w - 1], "   ┃", "    ") + "   ┃\n"
+            if i in par_ligne:
+                # Le contenu de la cellule j est le caractère d'indice 4 * j + 2
+                morceaux = []
+                debut = 0
+                for j, c in sorted(par_ligne[i]):
+                    if 0 <= j < w:
+                        morceaux.append(ligne[debut : 4 * j + 2])
+                        morceaux.append(c)
+                        debut = 4 * j + 3
+                morceaux.append(ligne[debut:])
+                ligne = "".join(morceaux)
+            yield ligne
+            precedente = (east, south)
+
         # Bas du tableau
-        txt += "┗"
-        for i in range(self.width - 1):
-            txt += "━━━┻"
-        txt += "━━━┛\n"
+        if precedente is not None:
+            yield "┗" + "━━━┻" * (w - 1) + "━━━┛\n"
 
-        return txt
+    def _rows(self):
+        """
+        Produit les passages du labyrinthe ligne par ligne, au format de stream_eller.
+
+        Yields:
+            tuple: Pour chaque ligne, le couple (east, south) d'octets valant 0 ou 1.
+        """
+
+        h, w = self.height, self.width
+        if isinstance(self.neighbors, WallBitmap):
+            east = self.neighbors.east
+            south = self.neighbors.south
+            for i in range(h):
+                yield east[i * w : (i + 1) * w], south[i * w : (i + 1) * w]
+            return
+
+        neighbors = self.neighbors
+        colonnes = range(w)
+        for i in range(h):
+            voisins = [neighbors[(i, j)] for j in colonnes]
+            yield (
+                bytes([(i, j + 1) in voisins[j] for j in colonnes]),
+                bytes([(i + 1, j) in voisins[j] for j in colonnes]),
+            )
+
+    def iter_lines(self, content: dict = None):
+        """
+        Produit la représentation textuelle du labyrinthe ligne par ligne, sans la construire en entier.
+
+        Les lignes mises bout à bout sont identiques à str(self), ou à overlay(content).
+
+        Args:
+            content (dict, optional): Un dictionnaire associant à des cellules leur contenu,
+                comme pour overlay. Par défaut aucun contenu.
+
+        Yields:
+            str: Une ligne de texte, terminée par un retour à la ligne.
+        """
+
+        return Maze.render_stream(self._rows(), content)
+
+    def write(self, stream, content: dict = None) -> None:
+        """
+        Écrit la représentation textuelle du labyrinthe dans un flux texte, ligne par ligne.
+
+        La mémoire utilisée ne dépend que de la largeur du labyrinthe,
+        ce qui permet d'enregistrer de très grands labyrinthes dans un fichier.
+
+        Args:
+            stream: Un flux texte ouvert en écriture (fichier, sys.stdout, io.StringIO, ...).
+            content (dict, optional): Un dictionnaire associant à des cellules leur contenu,
+                comme pour overlay. Par défaut aucun contenu.
+
+        Returns:
+            None
+        """
+
+        stream.writelines(self.iter_lines(content))
 
+    def overlay(self, content: dict = {}) -> str:
+        """
+        Renvoie une représentation textuelle du labyrinthe avec du contenu dans les cellules en utilisant des caractères ascii.
+
+        Le texte est produit par iter_lines : les cellules sans contenu ne sont pas parcourues une à une.
+
+        Args:
+            content (dict, optional): Un dictionnaire où chaque clé est une cellule et chaque valeur est le contenu de la cellule.
+                Le contenu est représenté par un caractère.
+                Par défaut le dictionnaire est vide.
+
+        Returns:
+            str: Le labyrinthe représenté sous forme de chaîne de caractères.
+        """
+
+        return "".join(self.iter_lines(content))
+
+    def _image_rows(self, cell_px: int, wall_px: int, overlay=None):
+        """
+        Produit les lignes de pixels de l'image du labyrinthe, en indices de la palette de image_export.
+
+        Pour chaque ligne du labyrinthe, une ligne de pixels traversant les cellules et une ligne
+        traversant les murs du sud sont construites par affectation de tranches à pas fixe :
+        une affectation par colonne de pixels d'une cellule, et non par cellule ou par pixel.
+        Ces deux lignes sont ensuite produites autant de fois que nécessaire (même objet).
+
+        Args:
+            cell_px (int): Le côté d'une cellule en pixels.
+            wall_px (int): L'épaisseur d'un mur en pixels.
+            overlay (optional): Un chemin (liste de cellules, toutes colorées, départ compris)
+                ou un champ de distances (array de taille height * width, comme celui de distance_field).
+                Par défaut aucun.
+
+        Yields:
+            bytes: Une ligne de pixels.
+        """
+
+        h, w = self.height, self.width
+        pas = cell_px + wall_px
+        largeur = wall_px + w * pas
+
+        # Passage ouvert : 0xFF pour masquer les couleurs, couleur du sol sinon
+        masque = bytes.maketrans(b"\x00\x01", b"\x00\xff")
+        sol = bytes.maketrans(b"\x00\x01", bytes([MUR, SOL]))
+        couleurs_sol = bytes([SOL]) * w
+
+        def et(a: bytes, b: bytes) -> bytes:
+            # ET bit à bit de deux lignes, via des entiers
+            return (
+                int.from_bytes(a, "little") & int.from_bytes(b, "little")
+            ).to_bytes(w, "little")
+
+        # Chemin : cellules et passages empruntés, regroupés par ligne
+        cellules, passages_est, passages_sud = {}, {}, {}
+        niveaux = None
+        if isinstance(overlay, array):
+            # Niveau du dégradé de chaque distance, le dernier élément (-1) pour l'inaccessible
+            dmax = max(max(overlay), 1)
+            niveaux = [DEGRADE + d * (NIVEAUX - 1) // dmax for d in range(dmax + 1)]
+            niveaux.append(SOL)
+        elif overlay:
+            precedente = None
+            for cell in overlay:
+                cellules.setdefault(cell[0], []).append(cell[1])
+                if precedente is not None:
+                    (i1, j1), (i2, j2) = sorted((precedente, cell))
+                    if i1 == i2 and j2 == j1 + 1:
+                        passages_est.setdefault(i1, []).append(j1)
+                    elif j1 == j2 and i2 == i1 + 1:
+                        passages_sud.setdefault(i1, []).append(j1)
+                precedente = cell
+
+        bord = bytes(largeur)
+        for _ in range(wall_px):
+            yield bord
+
+        for i, (east, south) in enumerate(self._rows()):
+            if niveaux is not None:
+                distances = overlay[i * w : (i + 1) * w]
+                couleurs = bytes(map(niveaux.__getitem__, distances))
+                # Un passage ouvert prend la couleur de sa cellule de gauche ou du haut
+                est = et(couleurs, east.translate(masque))
+                sud = et(couleurs, south.translate(masque))
+            else:
+                couleurs = couleurs_sol
+                est = east.translate(sol)
+                sud = south.translate(sol)
+                if i in cellules:
+                    couleurs = bytearray(couleurs)
+                    est = bytearray(est)
+                    sud = bytearray(sud)
+                    for j in cellules[i]:
+                        couleurs[j] = CHEMIN
+                    for j in passages_est.get(i, ()):
+                        est[j] = CHEMIN
+                    for j in passages_sud.get(i, ()):
+                        sud[j] = CHEMIN
+
+            # Ligne traversant les cellules et les murs de l'est
+            ligne = bytearray(largeur)
+            for t in range(cell_px):
+                ligne[wall_px + t :: pas] = couleurs
+            for t in range(cell_px, pas):
+                ligne[wall_px + t :: pas] = est
+            ligne = bytes(ligne)
+            for _ in range(cell_px):
+                yield ligne
+
+            # Ligne traversant les murs du sud, les coins restent des murs
+            ligne = bytearray(largeur)
+            for t in range(cell_px):
+                ligne[wall_px + t :: pas] = sud
+            ligne = bytes(ligne)
+            for _ in range(wall_px):
+                yield ligne
+
+    def to_image(
+        self,
+        cell_px: int = 4,
+        wall_px: int = 1,
+        overlay=None,
+        format: str = "png",
+        file=None,
+        start: tuple = None,
+    ) -> bytes:
+        """
+        Produit une image du labyrinthe au format PNG ou PPM, directement à partir des passages.
+
+        Les pixels sont calculés ligne par ligne (voir _image_rows) puis encodés au fil de l'eau :
+        seules quelques lignes de pixels sont en mémoire. Le PNG est en couleurs indexées
+        et n'utilise que zlib. Les murs sont noirs, les cellules blanches,
+        le chemin rouge et les distances vont du bleu (proche) au jaune (loin).
+        Avec la représentation "bitmap", un labyrinthe de 4000 x 4000 est rendu en quelques secondes.
+
+        Args:
+            cell_px (int, optional): Le côté d'une cellule en pixels. Par défaut 4.
+            wall_px (int, optional): L'épaisseur d'un mur en pixels. Par défaut 1.
+            overlay (optional): Un chemin à colorer (liste de cellules, par exemple le résultat
+                de solve_bfs) ou un champ de distances (array retourné par distance_field).
+                Par défaut aucun.
+            format (str, optional): "png" ou "ppm". Par défaut "png".
+            file (optional): Un chemin de fichier ou un flux binaire ouvert en écriture.
+                Par défaut aucun : l'image est retournée.
+            start (tuple, optional): La cellule de départ du chemin, colorée avec lui.
+                Les solveurs ne l'incluant pas dans leur résultat, on écrit par exemple
+                to_image(overlay=laby.solve_bfs(a, b), start=a). Par défaut aucune.
+
+        Returns:
+            bytes: Le contenu du fichier image si 'file' est absent, None sinon.
+        """
+
+        assert cell_px >= 1, f"Taille de cellule invalide : {cell_px}"
+        assert wall_px >= 0, f"Épaisseur de mur invalide : {wall_px}"
+        assert format in ("png", "ppm"), f"Format d'image inconnu : {format}"
+        if isinstance(overlay, array):
+            assert len(overlay) == self.height * self.width, "Champ de distances invalide"
+        elif start is not None:
+            overlay = [start] + list(overlay or [])
+
+        largeur = wall_px + self.width * (cell_px + wall_px)
+        hauteur = wall_px + self.height * (cell_px + wall_px)
+        encodeur = encode_png if format == "png" else encode_ppm
+        morceaux = encodeur(
+            largeur, hauteur, self._image_rows(cell_px, wall_px, overlay)
+        )
+
+        if file is None:
+            return b"".join(morceaux)
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "wb") as f:
+                f.writelines(morceaux)
+        else:
+            file.writelines(morceaux)
+
+        return None
+
+    @_cached_solver
     def solve_dfs(self, start: tuple, stop: tuple) -> list:
         """
         Retourne le chemin afin de résoudre le labyrinthe selon un parcours en profondeur.
@@ -672,32 +1946,45 @@ class Maze:
         # Chemin non-trouvé
         return None
 
-    def solve_bfs(self, start: tuple, stop: tuple) -> list:
+    @_cached_solver
+    def solve_bfs(
+        self, start: tuple, stop: tuple, distance_only: bool = False
+    ) -> list | int:
         """
         Retourne le chemin afin de résoudre le labyrinthe selon un parcours en largeur.
 
+        Le parcours s'arrête dès que 'stop' est atteint.
+        Le chemin obtenu est toujours le plus court, même si le labyrinthe contient des boucles.
+
         Args:
             start (tuple): Cellule de départ sous forme d'un couple (x, y).
             stop (tuple): Cellule d'arrivée sous forme d'un couple (x, y).
+            distance_only (bool, optional): Si vrai, retourne uniquement la longueur du plus court chemin
+                sans reconstruire le chemin. Par défaut False.
 
         Returns:
             list: Une liste de tuples représentant les cellules parcourues pour atteindre la sortie du labyrinthe.
+                Si 'distance_only' est vrai, un entier représentant la longueur de ce chemin.
         """
 
         # Initialisation
         # Placer 'start' dans la struture d’attente, et marquer D
-        file = [start]
+        file = deque([start])
         visited = {start: None}
+        distances = {start: 0}
 
         # Tant qu’il reste des cellules non-marquées
         while file:
 
             # Prendre la première cellule et la retirer de la structure
-            cell = file.pop(0)
+            cell = file.popleft()
 
             # Si 'cell' correspond à 'stop'
             if cell == stop:
 
+                if distance_only:
+                    return distances[cell]
+
                 # Reconstruction du chemin à partir des prédécesseurs
                 path = []
                 cell = stop
@@ -714,12 +2001,262 @@ class Maze:
                 if neighbor not in visited:
                     # La marquer
                     visited[neighbor] = cell
-                    # La mettre dans la structure d’attente
-                    file = [neighbor] + file
+                    distances[neighbor] = distances[cell] + 1
+                    # La mettre à la fin de la structure d’attente
+                    file.append(neighbor)
+
+        # Chemin non-trouvé
+        return None
+
+    @_cached_solver
+    def solve_bidirectional(self, start: tuple, stop: tuple) -> SearchResult:
+        """
+        Retourne le chemin afin de résoudre le labyrinthe selon un parcours en largeur bidirectionnel.
+
+        Deux parcours en largeur partent simultanément de 'start' et de 'stop'.
+        À chaque étape, on développe un niveau complet de la frontière la plus petite,
+        et on s'arrête dès que les deux parcours se rencontrent.
+        Le chemin obtenu est le plus court, comme avec solve_bfs.
+
+        Args:
+            start (tuple): Cellule de départ sous forme d'un couple (x, y).
+            stop (tuple): Cellule d'arrivée sous forme d'un couple (x, y).
+
+        Returns:
+            SearchResult: Une liste de tuples représentant les cellules parcourues pour atteindre la sortie du labyrinthe,
+                dont les attributs 'expanded' et 'visited' comptent les cellules développées et marquées des deux côtés.
+        """
+
+        if start == stop:
+            return SearchResult([], expanded=0, visited=1)
+
+        # Initialisation des deux parcours : prédécesseurs et distances
+        pred_start = {start: None}
+        pred_stop = {stop: None}
+        dist_start = {start: 0}
+        dist_stop = {stop: 0}
+        frontiere_start = [start]
+        frontiere_stop = [stop]
+        expanded = 0
+
+        # Tant que les deux parcours peuvent encore avancer
+        while frontiere_start and frontiere_stop:
+
+            # On développe le côté dont la frontière est la plus petite
+            if len(frontiere_start) <= len(frontiere_stop):
+                frontiere, pred, dist = frontiere_start, pred_start, dist_start
+                autre = dist_stop
+            else:
+                frontiere, pred, dist = frontiere_stop, pred_stop, dist_stop
+                autre = dist_start
+
+            # Développement d'un niveau complet
+            rencontre = None
+            meilleur = None
+            suivante = []
+            for cell in frontiere:
+                expanded += 1
+                for neighbor in self.get_reachable_cells(cell):
+                    # Si l'autre parcours a déjà marqué cette cellule, les parcours se rencontrent
+                    if neighbor in autre:
+                        longueur = dist[cell] + 1 + autre[neighbor]
+                        if meilleur is None or longueur < meilleur:
+                            meilleur = longueur
+                            rencontre = (cell, neighbor)
+                    if neighbor not in pred:
+                        pred[neighbor] = cell
+                        dist[neighbor] = dist[cell] + 1
+                        suivante.append(neighbor)
+
+            if frontiere is frontiere_start:
+                frontiere_start = suivante
+            else:
+                frontiere_stop = suivante
+
+            if rencontre is not None:
+                # On remet la rencontre dans le sens start -> stop
+                cell, neighbor = rencontre
+                if pred is pred_stop:
+                    cell, neighbor = neighbor, cell
+
+                # Reconstruction de la première moitié à partir des prédécesseurs de 'start'
+                path = []
+                while cell != start:
+                    path.append(cell)
+                    cell = pred_start[cell]
+                path.reverse()
+
+                # Reconstruction de la seconde moitié à partir des prédécesseurs de 'stop'
+                while neighbor is not None:
+                    path.append(neighbor)
+                    neighbor = pred_stop[neighbor]
+
+                # Chemin trouvé
+                return SearchResult(
+                    path, expanded=expanded, visited=len(pred_start) + len(pred_stop)
+                )
+
+        # Chemin non-trouvé
+        return None
+
+    @_cached_solver
+    def solve_astar(self, start: tuple, stop: tuple, heuristic=None) -> SearchResult:
+        """
+        Retourne le chemin afin de résoudre le labyrinthe selon l'algorithme A*.
+
+        Les cellules sont développées par ordre croissant de f = g + h,
+        où g est la distance parcourue depuis 'start' et h l'estimation donnée par l'heuristique.
+        À f égal, on privilégie la cellule la plus proche de 'stop' (h le plus petit),
+        puis la plus anciennement découverte.
+
+        Args:
+            start (tuple): Cellule de départ sous forme d'un couple (x, y).
+            stop (tuple): Cellule d'arrivée sous forme d'un couple (x, y).
+            heuristic (callable, optional): Fonction heuristic(c1, c2) estimant la distance entre deux cellules.
+                Elle doit être admissible pour garantir le plus court chemin.
+                Par défaut la distance de Manhattan (distance_man).
+
+        Returns:
+            SearchResult: Une liste de tuples représentant les cellules parcourues pour atteindre la sortie du labyrinthe,
+                dont l'attribut 'expanded' donne le nombre de cellules développées.
+        """
+
+        if heuristic is None:
+            heuristic = self.distance_man
+
+        # Initialisation
+        # Placer 'start' dans le tas, trié selon (f, h, ordre d'arrivée)
+        h = heuristic(start, stop)
+        tas = [(h, h, 0, start)]
+        compteur = 1
+        g = {start: 0}
+        visited = {start: None}
+        closed = set()
+
+        # Tant qu’il reste des cellules à développer
+        while tas:
+
+            # Prendre la cellule de plus petite priorité et la retirer du tas
+            _, _, _, cell = heappop(tas)
+
+            # Une cellule peut être présente plusieurs fois dans le tas,
+            # on ne la développe qu'une seule fois
+            if cell in closed:
+                continue
+            closed.add(cell)
+
+            # Si 'cell' correspond à 'stop'
+            if cell == stop:
+
+                # Reconstruction du chemin à partir des prédécesseurs
+                path = []
+                while cell != start:
+                    path.append(cell)
+                    cell = visited[cell]
+
+                # Chemin trouvé
+                return SearchResult(
+                    reversed(path), expanded=len(closed), visited=len(visited)
+                )
+
+            # Sinon, pour chaque voisine de 'cell'
+            g_voisin = g[cell] + 1
+            for neighbor in self.get_reachable_cells(cell):
+                # Si elle n'est pas développée et qu'on a trouvé un chemin plus court jusqu'à elle
+                if neighbor not in closed and (
+                    neighbor not in g or g_voisin < g[neighbor]
+                ):
+                    g[neighbor] = g_voisin
+                    visited[neighbor] = cell
+                    h = heuristic(neighbor, stop)
+                    heappush(tas, (g_voisin + h, h, compteur, neighbor))
+                    compteur += 1
 
         # Chemin non-trouvé
         return None
 
+    def _solve_from(self, start: tuple, stops: list) -> list:
+        """
+        Retourne les plus courts chemins d'une cellule vers plusieurs cellules, avec un seul parcours en largeur.
+
+        Le parcours s'arrête dès que toutes les cellules d'arrivée ont été atteintes.
+
+        Args:
+            start (tuple): Cellule de départ sous forme d'un couple (x, y).
+            stops (list): Les cellules d'arrivée.
+
+        Returns:
+            list: Pour chaque cellule d'arrivée, le chemin au format de solve_bfs, ou None si elle est inaccessible.
+        """
+
+        # Parcours en largeur jusqu'à avoir atteint toutes les cellules d'arrivée
+        restantes = set(stops) - {start}
+        visited = {start: None}
+        file = deque([start])
+        while file and restantes:
+            cell = file.popleft()
+            for neighbor in self.get_reachable_cells(cell):
+                if neighbor not in visited:
+                    visited[neighbor] = cell
+                    restantes.discard(neighbor)
+                    file.append(neighbor)
+
+        # Reconstruction de chaque chemin à partir des prédécesseurs partagés
+        paths = []
+        for stop in stops:
+            if stop not in visited:
+                paths.append(None)
+                continue
+            path = []
+            cell = stop
+            while cell != start:
+                path.append(cell)
+                cell = visited[cell]
+            paths.append(list(reversed(path)))
+
+        return paths
+
+    def solve_many(self, pairs: list, workers: int = 1) -> list:
+        """
+        Résout un ensemble de requêtes (départ, arrivée) en partageant les parcours par cellule de départ.
+
+        Les requêtes sont regroupées par cellule de départ : un seul parcours en largeur est fait par départ,
+        et tous les chemins sont reconstruits à partir de ses prédécesseurs.
+        Les départs peuvent être répartis sur plusieurs processus pour les très gros volumes de requêtes.
+
+        Args:
+            pairs (list): Une liste de couples (start, stop).
+            workers (int, optional): Le nombre de processus. Par défaut 1, c'est-à-dire dans le processus courant.
+                Avec None, le nombre de cœurs de la machine.
+
+        Returns:
+            list: Pour chaque requête, dans le même ordre, le plus court chemin au format de solve_bfs,
+                ou None si l'arrivée est inaccessible.
+        """
+
+        # Regroupement des requêtes par cellule de départ
+        groupes = {}
+        for start, stop in pairs:
+            groupes.setdefault(start, []).append(stop)
+        groupes = list(groupes.items())
+
+        # Le labyrinthe est transmis une seule fois par processus
+        try:
+            resultats = _pool_map(
+                _solve_source, groupes, workers, _init_solve_worker, (self,)
+            )
+        finally:
+            _init_solve_worker(None)
+
+        # Remise des chemins dans l'ordre des requêtes
+        chemins = {}
+        for (start, stops), paths in zip(groupes, resultats):
+            for stop, path in zip(stops, paths):
+                chemins[(start, stop)] = path
+
+        return [chemins[pair] for pair in pairs]
+
+    @_cached_solver
     def solve_rhr(self, start: tuple, stop: tuple) -> list:
         """
         Retourne le chemin afin de résoudre le labyrinthe selon la méthode de résolution en aveugle par main droite.
@@ -807,6 +2344,366 @@ class Maze:
         # Chemin non-trouvé
         return None
 
+    def distance_field(self, source: tuple) -> array:
+        """
+        Calcule la distance géodésique entre une cellule et toutes les cellules du labyrinthe.
+
+        Le calcul se fait par un unique parcours en largeur depuis 'source'.
+        Le résultat est mis en cache et invalidé automatiquement
+        lors d'un appel à add_wall, remove_wall, fill ou empty.
+        Seuls les 'distance_cache_size' champs les plus récemment demandés sont conservés,
+        chacun occupant 4 octets par cellule.
+
+        Args:
+            source (tuple): Cellule source sous forme d'un couple (x, y).
+
+        Returns:
+            array: Un tableau d'entiers de taille height * width où la case i * width + j
+                contient la distance de 'source' à (i, j), ou -1 si (i, j) est inaccessible.
+        """
+
+        assert (
+            0 <= source[0] < self.height and 0 <= source[1] < self.width
+        ), f"Erreur lors du calcul des distances depuis {source} : les coordonnées ne sont pas compatibles avec les dimensions du labyrinthe"
+
+        cache = self._distance_fields
+        field = cache.get(source)
+        if field is not None:
+            cache.move_to_end(source)
+        else:
+            w = self.width
+            field = array("i", [-1]) * (self.height * w)
+            field[source[0] * w + source[1]] = 0
+            file = deque([source])
+
+            # Parcours en largeur depuis la source
+            while file:
+                cell = file.popleft()
+                d = field[cell[0] * w + cell[1]] + 1
+                for neighbor in self.neighbors[cell]:
+                    k = neighbor[0] * w + neighbor[1]
+                    if field[k] == -1:
+                        field[k] = d
+                        file.append(neighbor)
+
+            cache[source] = field
+            while len(cache) > self.distance_cache_size:
+                cache.popitem(last=False)
+
+        # On retourne une copie pour que le cache ne puisse pas être modifié
+        return array("i", field)
+
+    def _sweep(self, source: tuple) -> tuple:
+        """
+        Parcours en largeur complet depuis une cellule, niveau par niveau.
+
+        Args:
+            source (tuple): Cellule de départ sous forme d'un couple (x, y).
+
+        Returns:
+            tuple: Le dictionnaire des prédécesseurs des cellules accessibles
+                et la liste des niveaux, le niveau d contenant les cellules à distance d de 'source'.
+        """
+
+        neighbors = self.neighbors
+        visited = {source: None}
+        niveaux = [[source]]
+        while True:
+            suivants = []
+            for cell in niveaux[-1]:
+                for neighbor in neighbors[cell]:
+                    if neighbor not in visited:
+                        visited[neighbor] = cell
+                        suivants.append(neighbor)
+            if not suivants:
+                return visited, niveaux
+            niveaux.append(suivants)
+
+    def diameter(self, exact: bool = False) -> tuple:
+        """
+        Retourne les deux cellules les plus éloignées l'une de l'autre et le chemin qui les relie.
+
+        Sur un labyrinthe parfait, deux parcours en largeur suffisent : la cellule la plus éloignée
+        d'une cellule quelconque est une extrémité du plus long chemin.
+        Sur un labyrinthe à boucles, ce double parcours ne donne qu'une borne inférieure :
+        on relance des parcours depuis la dernière extrémité trouvée tant que la distance augmente,
+        ce qui donne en pratique le diamètre ou une valeur très proche.
+        Avec 'exact', on complète par l'algorithme iFUB : on repart du milieu du chemin trouvé,
+        puis on calcule l'excentricité des cellules de plus en plus proches de ce milieu,
+        jusqu'à ce que les bornes se rejoignent. Le résultat est alors exact, mais le nombre
+        de parcours peut devenir grand sur les labyrinthes comportant beaucoup de boucles.
+        Si le labyrinthe n'est pas connexe, on retient la plus grande distance entre deux cellules
+        d'une même composante.
+
+        Args:
+            exact (bool, optional): Si vrai, garantit le plus long chemin sur un labyrinthe à boucles.
+                Par défaut False : le chemin retourné est long, mais pas forcément le plus long.
+
+        Returns:
+            tuple: Le triplet (c1, c2, path) où 'path' est le plus court chemin de c1 à c2 au format
+                de solve_bfs. None si le labyrinthe n'a aucune cellule.
+        """
+
+        neighbors = self.neighbors
+        meilleur = None
+        vues = set()
+
+        for cell in neighbors:
+            if cell in vues:
+                continue
+
+            # Premier parcours : une extrémité du plus long chemin (sur un arbre)
+            composante, niveaux = self._sweep(cell)
+            vues.update(composante)
+            a = niveaux[-1][0]
+
+            # Second parcours : l'autre extrémité
+            parents, niveaux = self._sweep(a)
+            candidat = (len(niveaux) - 1, a, niveaux[-1][0], parents)
+
+            # Un arbre de n cellules possède exactement n - 1 passages
+            passages = sum(len(neighbors[c]) for c in composante)
+            if passages != 2 * (len(composante) - 1):
+                # Nouveaux parcours depuis la dernière extrémité, tant que la distance augmente
+                while True:
+                    parents, niveaux = self._sweep(candidat[2])
+                    if len(niveaux) - 1 <= candidat[0]:
+                        break
+                    candidat = (len(niveaux) - 1, candidat[2], niveaux[-1][0], parents)
+                if exact:
+                    candidat = self._ifub(candidat)
+
+            if meilleur is None or candidat[0] > meilleur[0]:
+                meilleur = candidat
+
+        if meilleur is None:
+            return None
+
+        # Reconstruction du chemin à partir des prédécesseurs
+        _, a, b, parents = meilleur
+        path = []
+        cell = b
+        while cell != a:
+            path.append(cell)
+            cell = parents[cell]
+
+        return a, b, list(reversed(path))
+
+    def _ifub(self, candidat: tuple) -> tuple:
+        """
+        Calcule le diamètre exact d'une composante à boucles, selon l'algorithme iFUB.
+
+        Args:
+            candidat (tuple): Le quadruplet (longueur, c1, c2, prédécesseurs depuis c1)
+                obtenu par le double parcours.
+
+        Returns:
+            tuple: Un quadruplet de même forme pour le plus long des plus courts chemins.
+        """
+
+        # Milieu du chemin trouvé par le double parcours
+        longueur, a, b, parents = candidat
+        milieu = b
+        for _ in range(longueur // 2):
+            milieu = parents[milieu]
+
+        _, niveaux = self._sweep(milieu)
+        i = len(niveaux) - 1
+        borne_inf = longueur
+        borne_sup = 2 * i
+
+        # Deux cellules à distance au plus i - 1 du milieu sont à distance au plus 2 (i - 1) :
+        # il suffit de traiter les niveaux les plus éloignés tant que la borne inférieure n'est pas atteinte
+        while borne_sup > borne_inf and i > 0:
+            for cell in niveaux[i]:
+                parents_cell, niveaux_cell = self._sweep(cell)
+                if len(niveaux_cell) - 1 > borne_inf:
+                    borne_inf = len(niveaux_cell) - 1
+                    candidat = (borne_inf, cell, niveaux_cell[-1][0], parents_cell)
+            i -= 1
+            borne_sup = 2 * i
+
+        return candidat
+
+    @staticmethod
+    def diameter_many(mazes: list, exact: bool = False, workers: int = 1) -> list:
+        """
+        Calcule le diamètre de nombreux labyrinthes, éventuellement sur plusieurs processus.
+
+        Seules les extrémités et la longueur des chemins sont retournées,
+        ce qui limite les échanges entre processus et suffit à classer les labyrinthes.
+
+        Args:
+            mazes (list): Les labyrinthes.
+            exact (bool, optional): Transmis à diameter. Par défaut False.
+            workers (int, optional): Le nombre de processus. Par défaut 1, c'est-à-dire dans le processus courant.
+                Avec None, le nombre de cœurs de la machine.
+
+        Returns:
+            list: Pour chaque labyrinthe, dans le même ordre, le triplet (c1, c2, longueur), ou None.
+        """
+
+        tasks = [(maze, exact) for maze in mazes]
+
+        return _pool_map(_diameter_one, tasks, workers)
+
+    def metrics(self, start: tuple = (0, 0), stop: tuple = None) -> dict:
+        """
+        Calcule les statistiques du labyrinthe utiles pour estimer sa difficulté.
+
+        Tout est calculé sur le stockage "bitmap" (converti au besoin), en indices entiers :
+        les degrés des cellules d'un bloc (voir WallBitmap.degrees), les couloirs en suivant
+        une seule fois chaque cellule à deux passages, et la solution par un parcours en largeur.
+        Les indices hors de la grille n'ont pas besoin d'être testés : la dernière colonne de 'east'
+        et la dernière ligne de 'south' sont toujours à 0, y compris lus avec un indice négatif.
+
+        Args:
+            start (tuple, optional): Cellule de départ de la solution. Par défaut (0, 0).
+            stop (tuple, optional): Cellule d'arrivée de la solution. Par défaut le coin opposé.
+
+        Returns:
+            dict: Les statistiques :
+                - 'cells' : le nombre de cellules ;
+                - 'passages' : le nombre de passages ouverts ;
+                - 'degrees' : le nombre de cellules ayant 0, 1, 2, 3 et 4 passages ;
+                - 'dead_ends' : le nombre d'impasses (un seul passage) ;
+                - 'junctions' : le nombre de carrefours (au moins trois passages) ;
+                - 'corridors' : le nombre de couloirs de chaque longueur, entre impasses et carrefours ;
+                - 'solution_length' : la longueur du plus court chemin de 'start' à 'stop', ou None ;
+                - 'tortuosity' : le rapport entre cette longueur et la distance de Manhattan, ou None.
+        """
+
+        h, w = self.height, self.width
+        n = h * w
+        if stop is None:
+            stop = (h - 1, w - 1)
+
+        if isinstance(self.neighbors, WallBitmap):
+            bitmap = self.neighbors
+        else:
+            bitmap = WallBitmap.from_dict(self.neighbors, h, w)
+        east = bitmap.east
+        south = bitmap.south
+        degres = bitmap.degrees()
+
+        def suivante(cell: int, prev: int) -> int:
+            # Le passage d'une cellule à deux passages qui ne ramène pas à 'prev'
+            if east[cell] and cell + 1 != prev:
+                return cell + 1
+            if east[cell - 1] and cell - 1 != prev:
+                return cell - 1
+            if south[cell] and cell + w != prev:
+                return cell + w
+            return cell - w
+
+        # Couloirs partant des impasses et carrefours, chacun suivi une seule fois
+        corridors = {}
+        vues = bytearray(n)
+        for k in range(n):
+            if degres[k] == 2:
+                continue
+            for d, ouvert in (
+                (1, east[k]),
+                (-1, east[k - 1]),
+                (w, south[k]),
+                (-w, south[k - w]),
+            ):
+                first = k + d
+                if not ouvert or vues[first] or (degres[first] != 2 and first < k):
+                    continue
+                prev, cell = k, first
+                longueur = 1
+                while degres[cell] == 2:
+                    vues[cell] = 1
+                    prev, cell = cell, suivante(cell, prev)
+                    longueur += 1
+                corridors[longueur] = corridors.get(longueur, 0) + 1
+
+        # Boucles formées uniquement de couloirs
+        for k in range(n):
+            if degres[k] == 2 and not vues[k]:
+                vues[k] = 1
+                prev, cell = k, suivante(k, -1)
+                longueur = 1
+                while cell != k:
+                    vues[cell] = 1
+                    prev, cell = cell, suivante(cell, prev)
+                    longueur += 1
+                corridors[longueur] = corridors.get(longueur, 0) + 1
+
+        # Longueur de la solution, par un parcours en largeur niveau par niveau
+        longueur = None
+        if start in bitmap and stop in bitmap:
+            source = start[0] * w + start[1]
+            cible = stop[0] * w + stop[1]
+            marques = bytearray(n)
+            marques[source] = 1
+            niveau = [source]
+            d = 0
+            while niveau and not marques[cible]:
+                suivants = []
+                for cell in niveau:
+                    for voisine, ouvert in (
+                        (cell + 1, east[cell]),
+                        (cell - 1, east[cell - 1]),
+                        (cell + w, south[cell]),
+                        (cell - w, south[cell - w]),
+                    ):
+                        if ouvert and not marques[voisine]:
+                            marques[voisine] = 1
+                            suivants.append(voisine)
+                niveau = suivants
+                d += 1
+            if marques[cible]:
+                longueur = d
+
+        manhattan = self.distance_man(start, stop)
+        tortuosite = None
+        if longueur is not None and manhattan:
+            tortuosite = longueur / manhattan
+
+        degrees = {k: degres.count(k) for k in range(5)}
+
+        return {
+            "cells": n,
+            "passages": sum(degres) // 2,
+            "degrees": degrees,
+            "dead_ends": degrees[1],
+            "junctions": degrees[3] + degrees[4],
+            "corridors": dict(sorted(corridors.items())),
+            "solution_length": longueur,
+            "tortuosity": tortuosite,
+        }
+
+    @staticmethod
+    def metrics_many(
+        mazes: list, start: tuple = (0, 0), stop: tuple = None, workers: int = 1
+    ) -> dict:
+        """
+        Calcule les statistiques de nombreux labyrinthes, sous forme de table.
+
+        Args:
+            mazes (list): Les labyrinthes.
+            start (tuple, optional): Transmis à metrics. Par défaut (0, 0).
+            stop (tuple, optional): Transmis à metrics. Par défaut le coin opposé de chaque labyrinthe.
+            workers (int, optional): Le nombre de processus. Par défaut 1, c'est-à-dire dans le processus courant.
+                Avec None, le nombre de cœurs de la machine.
+
+        Returns:
+            dict: Pour chaque statistique de metrics, la liste de ses valeurs, dans l'ordre des labyrinthes.
+        """
+
+        tasks = [(maze, start, stop) for maze in mazes]
+        lignes = _pool_map(_metrics_one, tasks, workers)
+
+        # Passage d'une liste de lignes à une table par colonnes
+        table = {}
+        for ligne in lignes:
+            for colonne, valeur in ligne.items():
+                table.setdefault(colonne, []).append(valeur)
+
+        return table
+
     def distance_geo(self, c1: tuple, c2: tuple) -> int:
         """
         Calcule et retourne la distance géodésique entre deux cellules dans le labyrinthe.
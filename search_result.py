@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+
+class SearchResult(list):
+    """
+    Chemin retourné par un solveur, accompagné de compteurs sur la recherche.
+
+    S'utilise exactement comme la liste de cellules retournée par `solve_bfs`.
+
+    Attributes:
+        expanded (int): Le nombre de cellules développées, c'est-à-dire dont les voisines ont été examinées.
+        visited (int): Le nombre de cellules découvertes (marquées) pendant la recherche.
+    """
+
+    def __init__(self, path: list, expanded: int = 0, visited: int = 0) -> None:
+        """
+        Crée un nouveau résultat de recherche.
+
+        Args:
+            path (list): Les cellules du chemin, sans la cellule de départ.
+            expanded (int, optional): Le nombre de cellules développées. Par défaut 0.
+            visited (int, optional): Le nombre de cellules découvertes. Par défaut 0.
+
+        Returns:
+            None
+        """
+
+        super().__init__(path)
+        self.expanded = expanded
+        self.visited = visited
@@ -0,0 +1,111 @@
+from __future__ import annotations
+from collections import OrderedDict
+
+
+class SolverCache:
+    """
+    Cache LRU borné des résultats des solveurs d'un labyrinthe.
+
+    Les clés sont de la forme (version, solveur, start, stop, options) : la version du labyrinthe
+    change à chaque modification des murs, les anciens résultats ne sont donc plus jamais retrouvés
+    et finissent par être évincés.
+
+    Attributes:
+        maxsize (int): Le nombre maximal de résultats conservés.
+        enabled (bool): Indique si le cache est utilisé.
+        hits (int): Le nombre de résultats retrouvés dans le cache.
+        misses (int): Le nombre de résultats absents du cache.
+    """
+
+    def __init__(self, maxsize: int = 128, enabled: bool = True) -> None:
+        """
+        Crée un cache vide.
+
+        Args:
+            maxsize (int, optional): Le nombre maximal de résultats conservés. Par défaut 128.
+            enabled (bool, optional): Indique si le cache est utilisé. Par défaut True.
+
+        Returns:
+            None
+        """
+
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._data
+
+    def get(self, key: tuple, default=None):
+        """
+        Retourne le résultat associé à une clé et met à jour les statistiques.
+
+        Args:
+            key (tuple): La clé recherchée.
+            default (optional): La valeur retournée si la clé est absente. Par défaut None.
+
+        Returns:
+            Le résultat mis en cache, ou 'default'.
+        """
+
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def put(self, key: tuple, value) -> None:
+        """
+        Ajoute un résultat, en évinçant le moins récemment utilisé si le cache est plein.
+
+        Args:
+            key (tuple): La clé.
+            value: Le résultat.
+
+        Returns:
+            None
+        """
+
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Vide le cache et remet les statistiques à zéro.
+
+        Returns:
+            None
+        """
+
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Retourne les statistiques d'utilisation du cache.
+
+        Returns:
+            dict: Le nombre de succès ('hits'), d'échecs ('misses'), le taux de succès ('hit_rate')
+                et le nombre de résultats conservés ('size').
+        """
+
+        total = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._data),
+        }
@@ -1,4 +1,12 @@
+import io
+import pickle
+import random
+import time
 from maze import Maze
+from bulk_random import BulkRandom
+from distance_oracle import DistanceOracle
+from infinite_maze import InfiniteMaze
+from maintained_solution import MaintainedSolution
 
 laby = Maze(4, 4)
 print(laby.info())
@@ -184,3 +192,258 @@ print("Résolution par 'la main droite' :\n" + str(laby.overlay(str_solution)))
 
 print("Distance géodésique départ-arrivé :", laby.distance_geo((0, 0), (14, 14)))
 print("Distance de Manhattan départ-arrivé :", laby.distance_man((0, 0), (14, 14)))
+
+# Test de la structure union-find
+laby = Maze.gen_fusion(15, 15)
+composantes = laby.connectivity()
+print("Nombre de composantes connexes (fusion) :", composantes.count)
+print(
+    "(0, 0) et (14, 14) sont reliées :",
+    composantes.connected(0, 14 * laby.width + 14),
+)
+
+# Test du stockage compact 'bitmap'
+laby = Maze(5, 5, empty=True, backend="bitmap")
+laby.add_wall((0, 0), (0, 1))
+laby.add_wall((0, 1), (1, 1))
+print("Stockage bitmap :\n" + str(laby))
+print("Liste des murs (bitmap) :", laby.get_walls())
+laby.set_backend("dict")
+print("Conversion en dictionnaire :", laby.backend, laby.neighbors[(0, 1)])
+
+# Test de la résolution en largeur sur un labyrinthe avec des boucles
+laby = Maze(5, 5, empty=True)
+solution_bfs = laby.solve_bfs((0, 0), (4, 4))
+print(
+    "Plus court chemin sur un labyrinthe vide :",
+    len(solution_bfs) == laby.distance_man((0, 0), (4, 4)),
+)
+print("Distance seule :", laby.solve_bfs((0, 0), (4, 4), distance_only=True))
+
+# Test de la résolution par A*
+laby = Maze.gen_fusion(15, 15)
+solution_astar = laby.solve_astar((0, 0), (14, 14))
+print(
+    "A* donne le même chemin que le parcours en largeur :",
+    solution_astar == laby.solve_bfs((0, 0), (14, 14)),
+)
+print("Nombre de cellules développées par A* :", solution_astar.expanded)
+
+# Test de la résolution en largeur bidirectionnelle
+solution_bidir = laby.solve_bidirectional((0, 0), (14, 14))
+print(
+    "Le parcours bidirectionnel donne le même chemin :",
+    solution_bidir == laby.solve_bfs((0, 0), (14, 14)),
+)
+print("Nombre de cellules marquées (bidirectionnel) :", solution_bidir.visited)
+
+# Test de l'oracle de distances
+laby = Maze.gen_wilson(15, 15)
+oracle = DistanceOracle(laby)
+print("Le labyrinthe est parfait :", oracle.is_tree)
+print(
+    "L'oracle donne la même distance que le parcours en largeur :",
+    oracle.distance((0, 0), (14, 14)) == laby.solve_bfs((0, 0), (14, 14), True),
+)
+print("Chemin donné par l'oracle :", oracle.path((0, 0), (2, 2)))
+
+# Test du champ de distances
+laby = Maze(4, 4, empty=True)
+print("Champ de distances depuis (3, 3) :", list(laby.distance_field((3, 3))))
+laby.add_wall((3, 2), (3, 3))
+laby.add_wall((2, 3), (3, 3))
+print("Après ajout de murs autour de (3, 3) :", list(laby.distance_field((3, 3))))
+for cell in laby.neighbors:
+    laby.distance_field(cell)
+print(
+    "Champs gardés en cache :",
+    len(laby._distance_fields),
+    "sur",
+    laby.height * laby.width,
+)
+
+# Test de la génération d'Eller
+laby = Maze.gen_eller(8, 8)
+print("Génération par Eller :\n" + str(laby))
+
+# Test de la génération et de l'affichage ligne par ligne
+print("Génération d'Eller en flux :")
+for ligne in Maze.render_stream(Maze.stream_eller(4, 8)):
+    print(ligne, end="")
+
+# Test des générations par tranches (arbre binaire et sidewinder)
+laby = Maze.gen_btree_fast(4, 4)
+print("Génération rapide par arbre binaire :\n" + str(laby))
+laby = Maze.gen_sidewinder_fast(4, 4)
+print("Génération rapide sidewinder :\n" + str(laby))
+
+# Test de la génération par lots
+if __name__ == "__main__":
+    lot_1 = Maze.gen_many("wilson", 8, 6, 6, workers=1, seed=207)
+    lot_2 = Maze.gen_many("wilson", 8, 6, 6, workers=2, seed=207)
+    print(
+        "Génération par lots identique quel que soit le nombre de processus :",
+        [str(lab) for lab in lot_1] == [str(lab) for lab in lot_2],
+    )
+
+# Test de la génération reproductible avec un générateur aléatoire injecté
+laby_1 = Maze.gen_wilson(6, 6, rng=random.Random(207))
+laby_2 = Maze.gen_wilson(6, 6, rng=random.Random(207))
+print("Génération reproductible (random.Random) :", str(laby_1) == str(laby_2))
+laby_1 = Maze.gen_exploration(6, 6, rng=BulkRandom(207))
+laby_2 = Maze.gen_exploration(6, 6, rng=BulkRandom(207))
+print("Génération reproductible (BulkRandom) :", str(laby_1) == str(laby_2))
+
+# Test de la génération par tuiles
+if __name__ == "__main__":
+    laby = Maze.gen_tiled("wilson", 12, 12, tile=4, workers=2, seed=207)
+    print("Génération par tuiles :\n" + str(laby))
+    print("Composantes connexes (tuiles) :", laby.connectivity().count)
+    print("Labyrinthe parfait (tuiles) :", DistanceOracle(laby).is_tree)
+
+# Test du labyrinthe infini
+infini = InfiniteMaze(seed=207, chunk=8)
+solution = infini.solve_bfs((-5, -5), (5, 5))
+str_solution = {c: "*" for c in solution}
+str_solution[(-5, -5)] = "D"
+str_solution[(5, 5)] = "A"
+print("Labyrinthe infini, région autour de l'origine :")
+print(infini.overlay(-6, -6, 13, 13, str_solution))
+
+# Test de la génération par division récursive
+laby = Maze.gen_division(8, 8)
+print("Génération par division récursive :\n" + str(laby))
+
+# Test de la génération rapide par exploration
+laby = Maze.gen_exploration_fast(8, 8)
+print("Génération rapide par exploration :\n" + str(laby))
+print("Labyrinthe parfait (exploration) :", DistanceOracle(laby).is_tree)
+
+# Test du cache des solveurs
+laby = Maze.gen_wilson(10, 10)
+laby.solver_cache.enabled = True
+laby.solve_bfs((0, 0), (9, 9))
+laby.solve_bfs((0, 0), (9, 9))
+print("Statistiques du cache après 2 résolutions identiques :", laby.solver_cache.stats())
+version = laby.version
+laby.remove_wall(*laby.get_walls()[0])
+laby.solve_bfs((0, 0), (9, 9))
+print("Version modifiée par remove_wall :", laby.version != version)
+print("Statistiques du cache après modification :", laby.solver_cache.stats())
+print("Nouvel échec après modification :", laby.solver_cache.misses == 2)
+
+# Test de la résolution groupée
+laby = Maze.gen_fusion(15, 15)
+requetes = [((0, 0), (14, 14)), ((0, 0), (7, 7)), ((14, 0), (0, 14))]
+solutions = laby.solve_many(requetes)
+print(
+    "La résolution groupée donne les mêmes chemins que solve_bfs :",
+    solutions == [laby.solve_bfs(start, stop) for start, stop in requetes],
+)
+if __name__ == "__main__":
+    print(
+        "Résolution groupée sur 2 processus :",
+        laby.solve_many(requetes, workers=2) == solutions,
+    )
+
+# Test de la solution maintenue au fil des modifications
+tirage = random.Random(19)
+laby = Maze.gen_wilson(12, 12, rng=tirage)
+solution = MaintainedSolution(laby, (0, 0), (11, 11))
+for _ in range(20):
+    c1, c2 = tirage.choice(laby.get_walls())
+    laby.remove_wall(c1, c2)
+    if solution.cells is not None:
+        k = tirage.randrange(len(solution.cells) - 1)
+        laby.add_wall(solution.cells[k], solution.cells[k + 1])
+if solution.cells is None:
+    valide = laby.solve_bfs((0, 0), (11, 11)) is None
+else:
+    valide = all(
+        c2 in laby.neighbors[c1] for c1, c2 in zip(solution.cells, solution.cells[1:])
+    )
+print("La solution maintenue est valide :", valide)
+print("Stratégies employées :", solution.stats())
+solution.detach()
+
+# Latence d'un mur ajouté puis retiré sur le chemin d'un labyrinthe parfait de 200 x 200
+laby = Maze.gen_wilson(200, 200, rng=tirage)
+solution = MaintainedSolution(laby, (0, 0), (199, 199))
+durees = []
+for _ in range(100):
+    k = tirage.randrange(len(solution.cells) - 1)
+    c1, c2 = solution.cells[k], solution.cells[k + 1]
+    debut = time.perf_counter()
+    laby.add_wall(c1, c2)
+    laby.remove_wall(c1, c2)
+    durees.append((time.perf_counter() - debut) / 2)
+durees.sort()
+print("Latence médiane sous la milliseconde :", durees[len(durees) // 2] < 1e-3)
+print("Stratégies employées :", solution.stats())
+solution.detach()
+
+# Test du graphe des carrefours
+laby = Maze.gen_exploration(15, 15)
+graphe = laby.junction_graph()
+print("Taille du graphe des carrefours :", graphe.stats())
+print(
+    "Le graphe donne des chemins de même longueur que solve_bfs :",
+    len(graphe.dijkstra((0, 0), (14, 14))) == len(laby.solve_bfs((0, 0), (14, 14)))
+    and len(graphe.astar((3, 7), (12, 2))) == len(laby.solve_bfs((3, 7), (12, 2))),
+)
+print("Carrefours traversés :", graphe.dijkstra((0, 0), (14, 14), expand=False))
+
+# Test du diamètre
+laby = Maze.gen_wilson(12, 12)
+c1, c2, chemin = laby.diameter()
+print("Cellules les plus éloignées :", c1, c2, "à distance", len(chemin))
+print(
+    "Aucune cellule n'est plus loin de c1 que c2 :",
+    max(laby.distance_field(c1)) == len(chemin),
+)
+print(
+    "Diamètres de plusieurs labyrinthes :",
+    Maze.diameter_many(Maze.gen_many("wilson", 3, 10, 10, workers=1, seed=4)),
+)
+
+# Test des statistiques
+laby = Maze.gen_wilson(12, 12)
+print("Statistiques du labyrinthe :", laby.metrics())
+table = Maze.metrics_many(Maze.gen_many("exploration", 3, 12, 12, workers=1, seed=5))
+print("Impasses par labyrinthe :", table["dead_ends"])
+print("Tortuosité par labyrinthe :", table["tortuosity"])
+
+# Test de la vérification structurée
+laby = Maze.gen_wilson(10, 10)
+rapport = laby.validate()
+print("Labyrinthe valide :", rapport["valid"], "- parfait :", rapport["is_perfect"])
+laby.neighbors[(0, 0)].add((5, 5))
+print("Voisines non adjacentes :", laby.validate()["non_adjacent"])
+
+# Test de l'affichage en flux
+laby = Maze.gen_wilson(8, 8)
+solution = {c: "*" for c in laby.solve_bfs((0, 0), (7, 7))}
+print("Affichage en flux identique à __str__ :", "".join(laby.iter_lines()) == str(laby))
+flux = io.StringIO()
+laby.write(flux, solution)
+print("Écriture dans un flux identique à overlay :", flux.getvalue() == laby.overlay(solution))
+
+# Test de l'export en image
+laby = Maze.gen_wilson(10, 10)
+chemin = laby.solve_bfs((0, 0), (9, 9))
+image = laby.to_image(4, 1, overlay=chemin, start=(0, 0))
+print(
+    "Départ ajouté au chemin :",
+    image == laby.to_image(4, 1, overlay=[(0, 0)] + chemin),
+)
+print("Image PNG :", image[:8] == b"\x89PNG\r\n\x1a\n", len(image), "octets")
+image = laby.to_image(4, 1, overlay=laby.distance_field((0, 0)), format="ppm")
+print("Image PPM :", image.startswith(b"P6\n51 51\n255\n"), len(image) == 13 + 3 * 51 * 51)
+
+# Test de la sérialisation, sans caches ni fonctions enregistrées
+laby = Maze.gen_wilson(6, 6)
+laby.distance_field((0, 0))
+laby.add_listener(lambda event, c1, c2: None)
+copie = pickle.loads(pickle.dumps(laby))
+print("Sérialisation avec une lambda enregistrée :", str(copie) == str(laby))
+print("Caches et fonctions non transmis :", copie._distance_fields, copie._listeners)
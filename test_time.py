@@ -49,3 +49,51 @@ for _ in range(100):
     tmps += time.time() - deb
 
 print("Temps moyen de génération par wilson : ", round(tmps / 100, 3), " s")
+
+# Test de la génération rapide par arbre binaire
+tmps = 0
+for _ in range(100):
+    deb = time.time()
+    laby = Maze.gen_btree_fast(25, 25)
+    tmps += time.time() - deb
+
+print(
+    "Temps moyen de génération rapide par arbre binaire : ",
+    round(tmps / 100, 3),
+    " s",
+)
+
+# Test de la génération rapide 'sidewinder'
+tmps = 0
+for _ in range(100):
+    deb = time.time()
+    laby = Maze.gen_sidewinder_fast(25, 25)
+    tmps += time.time() - deb
+
+print("Temps moyen de génération rapide par sidewinder : ", round(tmps / 100, 3), " s")
+
+# Test de la génération par division récursive
+tmps = 0
+for _ in range(100):
+    deb = time.time()
+    laby = Maze.gen_division(25, 25)
+    tmps += time.time() - deb
+
+print(
+    "Temps moyen de génération par division récursive : ",
+    round(tmps / 100, 3),
+    " s",
+)
+
+# Test de la génération rapide par exploration exhaustive
+tmps = 0
+for _ in range(100):
+    deb = time.time()
+    laby = Maze.gen_exploration_fast(25, 25)
+    tmps += time.time() - deb
+
+print(
+    "Temps moyen de génération rapide par exploration exhaustive : ",
+    round(tmps / 100, 3),
+    " s",
+)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from maze import Maze
+
+
+class UnionFind:
+    """
+    Structure d'ensembles disjoints (union-find).
+
+    Les éléments sont des entiers de 0 à n-1. Pour un labyrinthe de largeur w,
+    la cellule (i, j) est représentée par l'entier i * w + j.
+    La recherche utilise la compression de chemin et l'union se fait par rang,
+    ce qui donne un coût amorti quasi-constant par opération.
+
+    Attributes:
+        parent (list): Le parent de chaque élément dans sa forêt.
+        rank (list): Le rang (borne sur la hauteur) de chaque racine.
+        count (int): Le nombre d'ensembles disjoints.
+    """
+
+    def __init__(self, n: int) -> None:
+        """
+        Crée n ensembles contenant chacun un seul élément.
+
+        Args:
+            n (int): Le nombre d'éléments.
+
+        Returns:
+            None
+        """
+
+        self.parent = list(range(n))
+        self.rank = [0] * n
+        self.count = n
+
+    @classmethod
+    def from_maze(cls, maze: Maze) -> UnionFind:
+        """
+        Construit les composantes connexes d'un labyrinthe.
+
+        Args:
+            maze (Maze): Le labyrinthe à analyser.
+
+        Returns:
+            UnionFind: Les ensembles de cellules reliées entre elles par un chemin.
+        """
+
+        w = maze.width
+        uf = cls(maze.height * w)
+        for (i, j), voisins in maze.neighbors.items():
+            for x, y in voisins:
+                uf.union(i * w + j, x * w + y)
+
+        return uf
+
+    def find(self, a: int) -> int:
+        """
+        Retourne le représentant de l'ensemble contenant a.
+
+        Args:
+            a (int): Un élément.
+
+        Returns:
+            int: La racine de l'ensemble de a.
+        """
+
+        parent = self.parent
+
+        # Recherche de la racine
+        root = a
+        while parent[root] != root:
+            root = parent[root]
+
+        # Compression du chemin : chaque élément parcouru pointe vers la racine
+        while parent[a] != root:
+            parent[a], a = root, parent[a]
+
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Fusionne les ensembles contenant a et b.
+
+        Args:
+            a (int): Un élément.
+            b (int): Un autre élément.
+
+        Returns:
+            bool: True si les deux ensembles étaient distincts, False sinon.
+        """
+
+        ra = self.find(a)
+        rb = self.find(b)
+        if ra == rb:
+            return False
+
+        # On rattache l'arbre le moins haut sous le plus haut
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
+        self.count -= 1
+
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        """
+        Indique si a et b appartiennent au même ensemble.
+
+        Args:
+            a (int): Un élément.
+            b (int): Un autre élément.
+
+        Returns:
+            bool: True si a et b sont dans le même ensemble.
+        """
+
+        return self.find(a) == self.find(b)
@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+
+class CellNeighbors:
+    """
+    Vue ensembliste des voisins accessibles d'une cellule d'un WallBitmap.
+
+    Se comporte comme l'ensemble `neighbors[cell]` d'un labyrinthe stocké sous forme de dictionnaire :
+    on peut tester l'appartenance, itérer, ajouter ou retirer une cellule.
+    Toute modification est symétrique puisque le passage est partagé par les deux cellules.
+    """
+
+    __slots__ = ("bitmap", "i", "j")
+
+    def __init__(self, bitmap: WallBitmap, i: int, j: int) -> None:
+        """
+        Crée une vue sur les voisins de la cellule (i, j).
+
+        Args:
+            bitmap (WallBitmap): Le stockage des passages.
+            i (int): La ligne de la cellule.
+            j (int): La colonne de la cellule.
+
+        Returns:
+            None
+        """
+
+        self.bitmap = bitmap
+        self.i = i
+        self.j = j
+
+    def _slot(self, cell: tuple) -> tuple:
+        """
+        Retourne le tableau et l'index du passage entre la cellule de la vue et la cellule donnée.
+
+        Args:
+            cell (tuple): Cellule sous forme d'un couple (x, y).
+
+        Returns:
+            tuple: Un couple (tableau, index), ou None si les cellules ne sont pas contigües.
+        """
+
+        b = self.bitmap
+        i, j = self.i, self.j
+        k = i * b.width + j
+        try:
+            x, y = cell
+        except (TypeError, ValueError):
+            return None
+        if x == i:
+            if y == j + 1 and y < b.width:
+                return b.east, k
+            if y == j - 1 and y >= 0:
+                return b.east, k - 1
+        elif y == j:
+            if x == i + 1 and x < b.height:
+                return b.south, k
+            if x == i - 1 and x >= 0:
+                return b.south, k - b.width
+        return None
+
+    def __contains__(self, cell: tuple) -> bool:
+        slot = self._slot(cell)
+        return slot is not None and slot[0][slot[1]] == 1
+
+    def __iter__(self):
+        b = self.bitmap
+        i, j, w = self.i, self.j, b.width
+        k = i * w + j
+        if i > 0 and b.south[k - w]:
+            yield (i - 1, j)
+        if b.south[k]:
+            yield (i + 1, j)
+        if j > 0 and b.east[k - 1]:
+            yield (i, j - 1)
+        if b.east[k]:
+            yield (i, j + 1)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (set, frozenset, CellNeighbors)):
+            return set(self) == set(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+    def add(self, cell: tuple) -> None:
+        """
+        Ouvre le passage vers la cellule donnée.
+
+        Args:
+            cell (tuple): Cellule contigüe sous forme d'un couple (x, y).
+
+        Returns:
+            None
+        """
+
+        slot = self._slot(cell)
+        if slot is None:
+            raise ValueError(
+                f"Les cellules {(self.i, self.j)} et {cell} ne sont pas contigües"
+            )
+        slot[0][slot[1]] = 1
+
+    def remove(self, cell: tuple) -> None:
+        """
+        Ferme le passage vers la cellule donnée, qui doit être ouvert.
+
+        Args:
+            cell (tuple): Cellule sous forme d'un couple (x, y).
+
+        Returns:
+            None
+        """
+
+        if cell not in self:
+            raise KeyError(cell)
+        self.discard(cell)
+
+    def discard(self, cell: tuple) -> None:
+        """
+        Ferme le passage vers la cellule donnée s'il existe.
+
+        Args:
+            cell (tuple): Cellule sous forme d'un couple (x, y).
+
+        Returns:
+            None
+        """
+
+        slot = self._slot(cell)
+        if slot is not None:
+            slot[0][slot[1]] = 0
+
+
+class WallBitmap:
+    """
+    Stockage compact des passages d'un labyrinthe.
+
+    Deux tableaux d'octets de taille height * width indiquent pour chaque cellule (i, j),
+    d'index i * width + j, si le passage vers l'est (i, j + 1) et vers le sud (i + 1, j) est ouvert.
+    La dernière colonne de `east` et la dernière ligne de `south` restent toujours à 0.
+
+    L'objet s'utilise comme le dictionnaire `neighbors` d'un labyrinthe :
+    `bitmap[cell]` retourne une vue ensembliste des voisins accessibles de la cellule.
+
+    Attributes:
+        height (int): La hauteur du labyrinthe.
+        width (int): La largeur du labyrinthe.
+        east (bytearray): Les passages vers l'est.
+        south (bytearray): Les passages vers le sud.
+    """
+
+    def __init__(self, height: int, width: int, empty: bool = False) -> None:
+        """
+        Crée un stockage rempli de murs, ou sans aucun mur.
+
+        Args:
+            height (int): La hauteur du labyrinthe, en nombre de cellules.
+            width (int): La largeur du labyrinthe, en nombre de cellules.
+            empty (bool, optional): Indique si le labyrinthe doit être créé sans murs.
+                Par défaut le labyrinthe est créé avec uniquement des murs.
+
+        Returns:
+            None
+        """
+
+        self.height = height
+        self.width = width
+        self.east = bytearray(height * width)
+        self.south = bytearray(height * width)
+        if empty:
+            self.empty()
+
+    @classmethod
+    def from_dict(cls, neighbors: dict, height: int, width: int) -> WallBitmap:
+        """
+        Construit un stockage compact à partir d'un dictionnaire de voisinages.
+
+        Seuls les passages est et sud de chaque cellule sont lus,
+        comme le fait l'affichage du labyrinthe.
+
+        Args:
+            neighbors (dict): Dictionnaire associant à chaque cellule l'ensemble de ses voisins accessibles.
+            height (int): La hauteur du labyrinthe.
+            width (int): La largeur du labyrinthe.
+
+        Returns:
+            WallBitmap: Le stockage compact équivalent.
+        """
+
+        bitmap = cls(height, width)
+        east = bitmap.east
+        south = bitmap.south
+        for (i, j), voisins in neighbors.items():
+            k = i * width + j
+            if (i, j + 1) in voisins and j + 1 < width:
+                east[k] = 1
+            if (i + 1, j) in voisins and i + 1 < height:
+                south[k] = 1
+
+        return bitmap
+
+    def to_dict(self) -> dict:
+        """
+        Construit le dictionnaire de voisinages équivalent.
+
+        Returns:
+            dict: Dictionnaire associant à chaque cellule l'ensemble de ses voisins accessibles.
+        """
+
+        w = self.width
+        neighbors = {(i, j): set() for i in range(self.height) for j in range(w)}
+        east = self.east
+        south = self.south
+        for k in range(self.height * w):
+            i, j = divmod(k, w)
+            if east[k]:
+                neighbors[(i, j)].add((i, j + 1))
+                neighbors[(i, j + 1)].add((i, j))
+            if south[k]:
+                neighbors[(i, j)].add((i + 1, j))
+                neighbors[(i + 1, j)].add((i, j))
+
+        return neighbors
+
+    def copy(self) -> WallBitmap:
+        """
+        Retourne une copie indépendante du stockage.
+
+        Returns:
+            WallBitmap: La copie.
+        """
+
+        bitmap = WallBitmap(self.height, self.width)
+        bitmap.east[:] = self.east
+        bitmap.south[:] = self.south
+
+        return bitmap
+
+    def fill(self) -> None:
+        """
+        Ferme tous les passages.
+
+        Returns:
+            None
+        """
+
+        n = self.height * self.width
+        self.east[:] = bytes(n)
+        self.south[:] = bytes(n)
+
+    def empty(self) -> None:
+        """
+        Ouvre tous les passages.
+
+        Returns:
+            None
+        """
+
+        h, w = self.height, self.width
+        # Toute la ligne est ouverte vers l'est sauf la dernière colonne
+        self.east[:] = (b"\x01" * (w - 1) + b"\x00") * h if w else b""
+        # Toutes les lignes sont ouvertes vers le sud sauf la dernière
+        self.south[:] = b"\x01" * (w * (h - 1)) + b"\x00" * w if h else b""
+
+    def degrees(self) -> bytes:
+        """
+        Retourne le nombre de passages ouverts de chaque cellule.
+
+        Les deux tableaux sont lus comme de grands entiers dont chaque octet est un chiffre :
+        le degré de la cellule k vaut east[k] + east[k - 1] + south[k] + south[k - width],
+        soit une somme d'entiers décalés d'un octet et d'une ligne, sans boucle Python.
+        Les chiffres ne dépassent jamais 4, il n'y a donc pas de retenue.
+
+        Returns:
+            bytes: Le degré de chaque cellule, d'index i * width + j.
+        """
+
+        n = self.height * self.width
+        if n == 0:
+            return b""
+
+        east = int.from_bytes(self.east, "little")
+        south = int.from_bytes(self.south, "little")
+        total = east + (east << 8) + south + (south << (8 * self.width))
+
+        return total.to_bytes(n + self.width + 1, "little")[:n]
+
+    def _check(self, cell: tuple) -> tuple:
+        try:
+            i, j = cell
+        except (TypeError, ValueError):
+            raise KeyError(cell) from None
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            raise KeyError(cell)
+        return i, j
+
+    def __getitem__(self, cell: tuple) -> CellNeighbors:
+        i, j = self._check(cell)
+        return CellNeighbors(self, i, j)
+
+    def __setitem__(self, cell: tuple, voisins) -> None:
+        view = self[cell]
+        for voisin in list(view):
+            view.discard(voisin)
+        for voisin in voisins:
+            view.add(voisin)
+
+    def __contains__(self, cell: tuple) -> bool:
+        try:
+            self._check(cell)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        for i in range(self.height):
+            for j in range(self.width):
+                yield (i, j)
+
+    def __len__(self) -> int:
+        return self.height * self.width
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, WallBitmap):
+            return (
+                self.height == other.height
+                and self.width == other.width
+                and self.east == other.east
+                and self.south == other.south
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        for i, j in self:
+            yield CellNeighbors(self, i, j)
+
+    def items(self):
+        for i, j in self:
+            yield (i, j), CellNeighbors(self, i, j)
+
+    def get(self, cell: tuple, default=None):
+        return self[cell] if cell in self else default